@@ -1,9 +1,68 @@
-"""A library for calculating Cartesian poses in different coordinate systems."""
+"""A library for calculating Cartesian poses in different coordinate systems.
 
-from .angles import RPY
-from .base_types import Isometry, Rotation, Vector3
-from .lazy_access import rx, ry, rz, x, y, z
-from .lib import Frame, Pose
-from .quaternion import Quaternion
+The public symbols are imported lazily on first access, so importing the package does not load the
+compiled core library until it is actually needed.
+"""
 
-__all__ = ["RPY", "Frame", "Isometry", "Pose", "Quaternion", "Rotation", "Vector3", "rx", "ry", "rz", "x", "y", "z"]
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .angles import RPY
+    from .base_types import Isometry, Rotation, Vector3, Vector3Array
+    from .lazy_access import rx, ry, rz, x, y, z
+    from .lib import Frame, Pose
+    from .quaternion import Quaternion
+
+_SYMBOL_MODULES = {
+    "RPY": ".angles",
+    "Frame": ".lib",
+    "Isometry": ".base_types",
+    "Pose": ".lib",
+    "Quaternion": ".quaternion",
+    "Rotation": ".base_types",
+    "Vector3": ".base_types",
+    "Vector3Array": ".base_types",
+    "rx": ".lazy_access",
+    "ry": ".lazy_access",
+    "rz": ".lazy_access",
+    "x": ".lazy_access",
+    "y": ".lazy_access",
+    "z": ".lazy_access",
+}
+
+__all__ = [
+    "RPY",
+    "Frame",
+    "Isometry",
+    "Pose",
+    "Quaternion",
+    "Rotation",
+    "Vector3",
+    "Vector3Array",
+    "rx",
+    "ry",
+    "rz",
+    "x",
+    "y",
+    "z",
+]
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
+
+# Hidden from type checkers, which resolve the symbols through the imports above.
+if not TYPE_CHECKING:
+
+    def __getattr__(name: str) -> Any:
+        module_name = _SYMBOL_MODULES.get(name)
+        if module_name is None:
+            msg = f"module {__name__!r} has no attribute {name!r}"
+            raise AttributeError(msg)
+        symbol = getattr(import_module(module_name, __name__), name)
+        globals()[name] = symbol
+        return symbol
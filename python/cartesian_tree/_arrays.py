@@ -0,0 +1,71 @@
+"""Contains helpers for passing arrays to the bindings."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import numpy as np
+    import numpy.typing as npt
+
+
+def to_array(values: Sequence[float]) -> npt.NDArray[np.float64]:
+    """Copies the values into a new one-dimensional float array.
+
+    Args:
+        values: The values to copy.
+
+    Returns:
+        The array of shape (N,).
+    """
+    # Imported here, so that importing the package does not load numpy.
+    import numpy as np  # noqa: PLC0415
+
+    return np.array(values, dtype=np.float64)
+
+
+def as_rows(values: npt.ArrayLike, width: int) -> npt.NDArray[np.float64]:
+    """Converts the values to a contiguous float array of shape (N, width).
+
+    Args:
+        values: The values to convert.
+        width: The expected number of columns.
+
+    Returns:
+        The converted array.
+
+    Raises:
+        ValueError: If the values are not of shape (N, width).
+    """
+    # Imported here, so that importing the package does not load numpy.
+    import numpy as np  # noqa: PLC0415
+
+    rows = np.ascontiguousarray(values, dtype=np.float64)
+    if rows.ndim != 2 or rows.shape[1] != width:  # noqa: PLR2004
+        msg = f"Expected an array of shape (N, {width}), got {rows.shape}."
+        raise ValueError(msg)
+    return rows
+
+
+def as_indices(values: npt.ArrayLike) -> npt.NDArray[np.int32]:
+    """Converts the values to a contiguous one-dimensional int32 array.
+
+    Args:
+        values: The values to convert.
+
+    Returns:
+        The converted array.
+
+    Raises:
+        ValueError: If the values are not one-dimensional.
+    """
+    # Imported here, so that importing the package does not load numpy.
+    import numpy as np  # noqa: PLC0415
+
+    indices = np.ascontiguousarray(values, dtype=np.int32)
+    if indices.ndim != 1:
+        msg = f"Expected an array of shape (N,), got {indices.shape}."
+        raise ValueError(msg)
+    return indices
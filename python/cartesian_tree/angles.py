@@ -2,12 +2,27 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+from ._arrays import to_array
 from cartesian_tree import _cartesian_tree as _core  # type: ignore[attr-defined]
 
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+    from .base_types import Rotation
+
 
 class RPY:
     """Defines a roll-pitch-yaw angle representation."""
 
+    __slots__ = ("__weakref__", "_core_rotation", "_rotation_cache", "_values_cache")
+
+    _core_rotation: _core.Rotation
+    _rotation_cache: Rotation | None
+    _values_cache: tuple[float, float, float] | None
+
     def __init__(self, roll: float, pitch: float, yaw: float) -> None:
         """Initializes the roll-pitch-yaw angles.
 
@@ -17,28 +32,53 @@ class RPY:
             yaw: The yaw angle in radians
         """
         self._core_rotation = _core.Rotation.from_rpy(roll, pitch, yaw)
+        self._values_cache = None
+        self._rotation_cache = None
+
+    @property
+    def _values(self) -> tuple[float, float, float]:
+        """The components, read from the core library on first access."""
+        if self._values_cache is None:
+            self._values_cache = self._core_rotation.as_rpy()
+        return self._values_cache
 
     @classmethod
     def identity(cls) -> RPY:
         """Initializes the identity RPY angles."""
-        instance = cls.__new__(cls)
-        instance._core_rotation = _core.Rotation.from_rpy(0.0, 0.0, 0.0)
-        return instance
+        return cls._from_rust(_core.Rotation.from_rpy(0.0, 0.0, 0.0))
+
+    @classmethod
+    def from_quaternion(cls, x: float, y: float, z: float, w: float) -> RPY:
+        """Initializes the RPY angles from quaternion values.
+
+        The conversion happens once in the core library, which is cheaper than
+        `Rotation.from_quaternion(...).as_rpy()`.
+
+        Args:
+            x: The x value.
+            y: The y value.
+            z: The z value.
+            w: The w value.
+
+        Returns:
+            The initialized instance.
+        """
+        return cls._from_rust(_core.Rotation.rpy_from_quaternion(x, y, z, w))
 
     @property
     def roll(self) -> float:
         """The roll angle in radians."""
-        return self._core_rotation.as_rpy()[0]
+        return self._values[0]
 
     @property
     def pitch(self) -> float:
         """The pitch angle in radians."""
-        return self._core_rotation.as_rpy()[1]
+        return self._values[1]
 
     @property
     def yaw(self) -> float:
         """The yaw angle in radians."""
-        return self._core_rotation.as_rpy()[2]
+        return self._values[2]
 
     def as_list(self) -> list[float]:
         """Returns the angles as list.
@@ -46,7 +86,7 @@ class RPY:
         Returns:
             The angle as list.
         """
-        return list(self._core_rotation.as_rpy())
+        return list(self._values)
 
     def as_tuple(self) -> tuple[float, float, float]:
         """Returns the angles as tuple.
@@ -54,16 +94,41 @@ class RPY:
         Returns:
             The angles as tuple.
         """
-        return self._core_rotation.as_rpy()
+        return self._values
+
+    def as_array(self) -> npt.NDArray[np.float64]:
+        """Returns the angles as array.
+
+        Returns:
+            The angles as array of shape (3,).
+        """
+        return to_array(self._values)
+
+    def to_rotation(self) -> Rotation:
+        """Converts the angles to a rotation.
+
+        The rotation is created on the first call and reused afterwards.
+
+        Returns:
+            The rotation.
+        """
+        if self._rotation_cache is None:
+            # Imported here, as base_types imports this module.
+            from .base_types import Rotation  # noqa: PLC0415
+
+            self._rotation_cache = Rotation._from_rust(self._core_rotation)
+        return self._rotation_cache
 
     @classmethod
     def _from_rust(cls, rust_rotation: _core.Rotation) -> RPY:
         instance = cls.__new__(cls)
         instance._core_rotation = rust_rotation
+        instance._values_cache = None
+        instance._rotation_cache = None
         return instance
 
     def __str__(self) -> str:
-        roll, pitch, yaw = self._core_rotation.as_rpy()
+        roll, pitch, yaw = self._values
         return f"({roll}, {pitch}, {yaw})"
 
     def __repr__(self) -> str:
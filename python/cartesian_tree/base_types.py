@@ -2,17 +2,34 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, ClassVar
 
+from ._arrays import as_rows
 from .angles import RPY
 from .quaternion import Quaternion
 from cartesian_tree import _cartesian_tree as _core  # type: ignore[attr-defined]
 
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+# From this number of points on, rotating via a prebuilt matrix beats the quaternion formula.
+_MATRIX_BATCH_THRESHOLD = 16
+
 
 class Rotation:
     """Defines a unified rotation representation."""
 
+    __slots__ = ("__weakref__", "_binding_structure", "_core_rotation", "_quaternion_cache", "_rpy_cache")
+
+    IDENTITY: ClassVar[Rotation]
+    # RPY-backed identity, so that `from_rpy` keeps its representation for zero angles.
+    _RPY_IDENTITY: ClassVar[Rotation]
+
     _core_rotation: _core.Rotation
+    _binding_structure: _core.Rotation
+    _quaternion_cache: Quaternion | None
+    _rpy_cache: RPY | None
 
     @classmethod
     def from_quaternion(cls, x: float, y: float, z: float, w: float) -> Rotation:
@@ -27,9 +44,9 @@ class Rotation:
         Returns:
             The initialized instance.
         """
-        instance = cls.__new__(cls)
-        instance._core_rotation = _core.Rotation.from_quaternion(x, y, z, w)
-        return instance
+        if x == 0.0 and y == 0.0 and z == 0.0 and w == 1.0:
+            return cls.IDENTITY
+        return cls._from_rust(_core.Rotation.from_quaternion(x, y, z, w))
 
     @classmethod
     def from_rpy(cls, roll: float, pitch: float, yaw: float) -> Rotation:
@@ -43,53 +60,144 @@ class Rotation:
         Returns:
             The initialized instance.
         """
-        instance = cls.__new__(cls)
-        instance._core_rotation = _core.Rotation.from_rpy(roll, pitch, yaw)
-        return instance
+        if roll == 0.0 and pitch == 0.0 and yaw == 0.0:
+            return cls._RPY_IDENTITY
+        return cls._from_rust(_core.Rotation.from_rpy(roll, pitch, yaw))
 
     @classmethod
     def identity(cls) -> Rotation:
-        """Initializes the identity rotation."""
-        instance = cls.__new__(cls)
-        instance._core_rotation = _core.Rotation.identity()
-        return instance
+        """Returns the identity rotation.
+
+        Rotations are immutable, so the shared instance `Rotation.IDENTITY` is returned.
+        """
+        return cls.IDENTITY
+
+    @staticmethod
+    def from_rpy_batch(rpy: npt.ArrayLike) -> npt.NDArray[np.float64]:
+        """Converts a batch of RPY values to quaternions with a single call into the core library.
+
+        Args:
+            rpy: The roll, pitch and yaw values as array of shape (N, 3).
+
+        Returns:
+            The quaternions as array of shape (N, 4) in the form x, y, z and w.
+
+        Raises:
+            ValueError: If the values are not of shape (N, 3).
+        """
+        return _core.Rotation.from_rpy_batch(as_rows(rpy, 3))
+
+    @staticmethod
+    def to_rpy_batch(quaternions: npt.ArrayLike) -> npt.NDArray[np.float64]:
+        """Converts a batch of quaternions to RPY values with a single call into the core library.
+
+        Args:
+            quaternions: The unit quaternions as array of shape (N, 4) in the form x, y, z and w.
+
+        Returns:
+            The roll, pitch and yaw values as array of shape (N, 3).
+
+        Raises:
+            ValueError: If the values are not of shape (N, 4).
+        """
+        return _core.Rotation.to_rpy_batch(as_rows(quaternions, 4))
 
     def as_quaternion(self) -> Quaternion:
         """Converts the rotation to quaternion.
 
+        The conversion is computed on the first call and reused afterwards.
+
         Returns:
             The quaternion representation of the rotation.
         """
-        return Quaternion._from_rust(self._core_rotation)
+        if self._quaternion_cache is None:
+            self._quaternion_cache = Quaternion._from_rust(self._core_rotation)
+        return self._quaternion_cache
 
     def as_rpy(self) -> RPY:
         """Converts the rotation to RPY.
 
+        The conversion is computed on the first call and reused afterwards.
+
         Returns:
             The RPY representation of the rotation.
         """
-        return RPY._from_rust(self._core_rotation)
+        if self._rpy_cache is None:
+            self._rpy_cache = RPY._from_rust(self._core_rotation)
+        return self._rpy_cache
 
-    @property
-    def _binding_structure(self) -> Any:
-        return self._core_rotation
+    def compose_batch(self, quaternions: npt.ArrayLike) -> npt.NDArray[np.float64]:
+        """Composes the rotation with a batch of quaternions with a single call into the core library.
+
+        Each quaternion is applied first, followed by this rotation.
+
+        Args:
+            quaternions: The unit quaternions as array of shape (N, 4) in the form x, y, z and w.
+
+        Returns:
+            The composed quaternions as array of shape (N, 4).
+
+        Raises:
+            ValueError: If the values are not of shape (N, 4).
+        """
+        return self._core_rotation.compose_batch(as_rows(quaternions, 4))
+
+    def to_matrix(self) -> npt.NDArray[np.float64]:
+        """Converts the rotation to a rotation matrix.
+
+        Returns:
+            The rotation matrix as array of shape (3, 3).
+        """
+        return self._core_rotation.to_matrix()
+
+    def apply_batch(self, points: npt.ArrayLike) -> npt.NDArray[np.float64]:
+        """Rotates a batch of points with a single call into the core library.
+
+        Larger batches are rotated with a rotation matrix that is built once for all points.
+
+        Args:
+            points: The points as array of shape (N, 3).
+
+        Returns:
+            The rotated points as array of shape (N, 3).
+
+        Raises:
+            ValueError: If the points are not of shape (N, 3).
+        """
+        rows = as_rows(points, 3)
+        if rows.shape[0] >= _MATRIX_BATCH_THRESHOLD:
+            return self._core_rotation.apply_matrix_batch(rows)
+        return self._core_rotation.apply_batch(rows)
 
     @classmethod
     def _from_rust(cls, rust_rotation: _core.Rotation) -> Rotation:
         instance = cls.__new__(cls)
         instance._core_rotation = rust_rotation
+        instance._binding_structure = rust_rotation
+        instance._quaternion_cache = None
+        instance._rpy_cache = None
         return instance
 
     def __str__(self) -> str:
-        return self._core_rotation.__str__()
+        return str(self._core_rotation)
 
     def __repr__(self) -> str:
-        return self._core_rotation.__repr__()
+        return repr(self._core_rotation)
+
+
+Rotation.IDENTITY = Rotation._from_rust(_core.Rotation.identity())
+Rotation._RPY_IDENTITY = Rotation._from_rust(_core.Rotation.from_rpy(0.0, 0.0, 0.0))
 
 
 class Vector3:
     """Defines a vector in Cartesian space."""
 
+    __slots__ = ("__weakref__", "_binding_structure", "_core_vector", "_values_cache")
+
+    _core_vector: _core.Vector3
+    _binding_structure: _core.Vector3
+    _values_cache: tuple[float, float, float] | None
+
     def __init__(self, x: float, y: float, z: float) -> None:
         """Initializes the vector.
 
@@ -99,6 +207,8 @@ class Vector3:
             z: The z value.
         """
         self._core_vector = _core.Vector3(x, y, z)
+        self._binding_structure = self._core_vector
+        self._values_cache = None
 
     @classmethod
     def zeros(cls) -> Vector3:
@@ -109,24 +219,27 @@ class Vector3:
         """
         return cls(0.0, 0.0, 0.0)
 
+    @property
+    def _values(self) -> tuple[float, float, float]:
+        """The components, read from the core library on first access."""
+        if self._values_cache is None:
+            self._values_cache = self._core_vector.to_tuple()
+        return self._values_cache
+
     @property
     def x(self) -> float:
         """The x value."""
-        return self._core_vector.x
+        return self._values[0]
 
     @property
     def y(self) -> float:
         """The y value."""
-        return self._core_vector.y
+        return self._values[1]
 
     @property
     def z(self) -> float:
         """The z value."""
-        return self._core_vector.z
-
-    @property
-    def _binding_structure(self) -> Any:
-        return self._core_vector
+        return self._values[2]
 
     def as_list(self) -> list[float]:
         """Returns the vector as list.
@@ -134,7 +247,7 @@ class Vector3:
         Returns:
             The vector as list.
         """
-        return [self.x, self.y, self.z]
+        return list(self._values)
 
     def as_tuple(self) -> tuple[float, float, float]:
         """Returns the vector as tuple.
@@ -142,19 +255,110 @@ class Vector3:
         Returns:
             The vector as tuple.
         """
-        return (self.x, self.y, self.z)
+        return self._values
+
+    def normalize(self) -> Vector3:
+        """Returns the normalized vector.
+
+        Returns:
+            The vector scaled to unit length.
+
+        Raises:
+            ValueError: If the vector has zero or non-finite length.
+        """
+        return Vector3._from_rust(self._core_vector.normalize())
+
+    def as_array(self) -> npt.NDArray[np.float64]:
+        """Returns the vector as array.
+
+        Returns:
+            The vector as array of shape (3,).
+        """
+        return self._core_vector.as_array()
+
+    @classmethod
+    def _from_rust(cls, rust_vector: _core.Vector3) -> Vector3:
+        instance = cls.__new__(cls)
+        instance._core_vector = rust_vector
+        instance._binding_structure = rust_vector
+        instance._values_cache = None
+        return instance
+
+    def __str__(self) -> str:
+        return str(self._core_vector)
+
+    def __repr__(self) -> str:
+        return repr(self._core_vector)
+
+
+class Vector3Array:
+    """Defines a contiguous array of vectors in Cartesian space.
+
+    The vectors are stored in a single buffer owned by the core library, so that bulk operations
+    need a single call instead of one call per vector.
+    """
+
+    __slots__ = ("__weakref__", "_binding_structure", "_core_vector_array")
+
+    def __init__(self, vectors: npt.ArrayLike) -> None:
+        """Initializes the vector array.
+
+        Args:
+            vectors: The vectors as array of shape (N, 3).
+
+        Raises:
+            ValueError: If the vectors are not of shape (N, 3).
+        """
+        self._core_vector_array = _core.Vector3Array(as_rows(vectors, 3))
+        self._binding_structure = self._core_vector_array
+
+    def rotate(self, rotation: Rotation) -> Vector3Array:
+        """Rotates all vectors.
+
+        Args:
+            rotation: The rotation to apply.
+
+        Returns:
+            A new array with the rotated vectors.
+        """
+        return Vector3Array._from_rust(self._core_vector_array.rotate(rotation._binding_structure))
+
+    def as_array(self) -> npt.NDArray[np.float64]:
+        """Returns the vectors as array.
+
+        Returns:
+            The vectors as array of shape (N, 3).
+        """
+        return self._core_vector_array.as_array()
+
+    @classmethod
+    def _from_rust(cls, rust_vector_array: _core.Vector3Array) -> Vector3Array:
+        instance = cls.__new__(cls)
+        instance._core_vector_array = rust_vector_array
+        instance._binding_structure = rust_vector_array
+        return instance
+
+    def __len__(self) -> int:
+        return len(self._core_vector_array)
+
+    def __getitem__(self, index: int) -> Vector3:
+        binding_vector = self._core_vector_array[index]
+        return Vector3._from_rust(binding_vector)
 
     def __str__(self) -> str:
-        return self._core_vector.__str__()
+        return str(self._core_vector_array)
 
     def __repr__(self) -> str:
-        return self._core_vector.__repr__()
+        return repr(self._core_vector_array)
 
 
 class Isometry:
     """Rigid 3D transformation."""
 
+    __slots__ = ("__weakref__", "_binding_structure", "_core_isometry")
+
     _core_isometry: _core.Isometry
+    _binding_structure: _core.Isometry
 
     @classmethod
     def identity(cls) -> Isometry:
@@ -163,9 +367,7 @@ class Isometry:
         This isometry applies the rotation R with its axis passing through the point P.
         This effectively lets P invariant.
         """
-        instance = cls.__new__(cls)
-        instance._core_isometry = _core.Isometry.identity()
-        return instance
+        return cls._from_rust(_core.Isometry.identity())
 
     @classmethod
     def from_translation(cls, translation: Vector3) -> Isometry:
@@ -179,9 +381,7 @@ class Isometry:
         Returns:
             The initialized isometry instance.
         """
-        instance = cls.__new__(cls)
-        instance._core_isometry = _core.Isometry.from_translation(translation._binding_structure)
-        return instance
+        return cls._from_rust(_core.Isometry.from_translation(translation._binding_structure))
 
     @classmethod
     def from_rotation(cls, rotation: Rotation) -> Isometry:
@@ -195,9 +395,7 @@ class Isometry:
         Returns:
             The initialized isometry instance.
         """
-        instance = cls.__new__(cls)
-        instance._core_isometry = _core.Isometry.from_rotation(rotation._binding_structure)
-        return instance
+        return cls._from_rust(_core.Isometry.from_rotation(rotation._binding_structure))
 
     @classmethod
     def from_parts(cls, translation: Vector3, rotation: Rotation) -> Isometry:
@@ -210,9 +408,7 @@ class Isometry:
         Returns:
             The initialized isometry instance.
         """
-        instance = cls.__new__(cls)
-        instance._core_isometry = _core.Isometry.from_parts(translation._binding_structure, rotation._binding_structure)
-        return instance
+        return cls._from_rust(_core.Isometry.from_parts(translation._binding_structure, rotation._binding_structure))
 
     def decompose(self) -> tuple[Vector3, Rotation]:
         """Decomposes the isometry into translation and rotation.
@@ -221,7 +417,7 @@ class Isometry:
             The translation and rotation.
         """
         binding_pos, binding_rot = self._core_isometry.decompose()
-        return Vector3(*binding_pos.to_tuple()), Rotation._from_rust(binding_rot)
+        return Vector3._from_rust(binding_pos), Rotation._from_rust(binding_rot)
 
     def translation(self) -> Vector3:
         """Returns the translation part of the isometry.
@@ -230,7 +426,7 @@ class Isometry:
             The translation part.
         """
         binding_translation = self._core_isometry.translation()
-        return Vector3(*binding_translation.to_tuple())
+        return Vector3._from_rust(binding_translation)
 
     def rotation(self) -> Rotation:
         """Returns the rotation part of the isometry.
@@ -250,20 +446,17 @@ class Isometry:
         return Isometry._from_rust(self._core_isometry.inverse())
 
     def __mul__(self, other: Isometry) -> Isometry:
-        return Isometry._from_rust(self._core_isometry.__mul__(other._binding_structure))
-
-    @property
-    def _binding_structure(self) -> Any:
-        return self._core_isometry
+        return Isometry._from_rust(self._core_isometry * other._binding_structure)
 
     @classmethod
     def _from_rust(cls, rust_isometry: _core.Isometry) -> Isometry:
         instance = cls.__new__(cls)
         instance._core_isometry = rust_isometry
+        instance._binding_structure = rust_isometry
         return instance
 
     def __str__(self) -> str:
-        return self._core_isometry.__str__()
+        return str(self._core_isometry)
 
     def __repr__(self) -> str:
-        return self._core_isometry.__repr__()
+        return repr(self._core_isometry)
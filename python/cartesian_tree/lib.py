@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
+from ._arrays import as_indices, as_rows
 from .base_types import Isometry, Rotation, Vector3
 from cartesian_tree import _cartesian_tree as _core  # type: ignore[attr-defined]
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import numpy as np
+    import numpy.typing as npt
+
     from .lazy_access import LazyRotation, LazyTranslation
 
 
@@ -25,6 +31,7 @@ class Frame:
             name: The name of the root frame.
         """
         self._core_frame = _core.Frame(name)
+        self._binding_structure = self._core_frame
 
     @property
     def name(self) -> str:
@@ -40,7 +47,7 @@ class Frame:
     def position(self) -> Vector3:
         """The position of the frame relative to its parent."""
         binding_position = self._core_frame.position
-        return Vector3(*binding_position.to_tuple())
+        return Vector3._from_rust(binding_position)
 
     @property
     def orientation(self) -> Rotation:
@@ -65,6 +72,46 @@ class Frame:
         binding_frame = self._core_frame.add_child(name, position._binding_structure, orientation._binding_structure)
         return Frame._from_rust(binding_frame)
 
+    def add_child_quat(
+        self, name: str, position: tuple[float, float, float], quaternion: tuple[float, float, float, float]
+    ) -> Frame:
+        """Adds a new child frame from raw position and quaternion values.
+
+        Equivalent to `add_child` with `Vector3` and `Rotation.from_quaternion`, but without creating
+        the intermediate objects.
+
+        Args:
+            name: The name of the new child frame.
+            position: The translational offset from the parent as x, y and z.
+            quaternion: The orientational offset from the parent as x, y, z and w. It will be normalized.
+
+        Returns:
+            The newly created child frame.
+
+        Raises:
+            ValueError: If a child with the same name already exists.
+        """
+        return Frame._from_rust(self._core_frame.add_child_quat(name, position, quaternion))
+
+    def add_child_rpy(self, name: str, position: tuple[float, float, float], rpy: tuple[float, float, float]) -> Frame:
+        """Adds a new child frame from raw position and RPY values.
+
+        Equivalent to `add_child` with `Vector3` and `Rotation.from_rpy`, but without creating the
+        intermediate objects.
+
+        Args:
+            name: The name of the new child frame.
+            position: The translational offset from the parent as x, y and z.
+            rpy: The orientational offset from the parent as roll, pitch and yaw in radians.
+
+        Returns:
+            The newly created child frame.
+
+        Raises:
+            ValueError: If a child with the same name already exists.
+        """
+        return Frame._from_rust(self._core_frame.add_child_rpy(name, position, rpy))
+
     def calibrate_child(
         self, name: str, desired_position: Vector3, desired_orientation: Rotation, reference_pose: Pose
     ) -> Frame:
@@ -114,7 +161,7 @@ class Frame:
         """
         binding_position, binding_rotation = self._core_frame.transformation()
         return (
-            Vector3(*binding_position.to_tuple()),
+            Vector3._from_rust(binding_position),
             Rotation._from_rust(binding_rotation),
         )
 
@@ -154,6 +201,24 @@ class Frame:
         """
         self._core_frame.apply_in_local_frame(isometry._binding_structure)
 
+    def transform_points(self, points: npt.ArrayLike, target_frame: Frame) -> npt.NDArray[np.float64]:
+        """Expresses a batch of points given in this frame in the target frame.
+
+        The transformation between the frames is resolved once and applied to all points with a
+        single call into the core library.
+
+        Args:
+            points: The points in this frame as array of shape (N, 3).
+            target_frame: The frame to express the points in.
+
+        Returns:
+            The points in the target frame as array of shape (N, 3).
+
+        Raises:
+            ValueError: If the points are not of shape (N, 3) or the frames share no common ancestor.
+        """
+        return self._core_frame.transform_points(as_rows(points, 3), target_frame._binding_structure)
+
     def to_json(self) -> str:
         """Serializes the frame tree to a JSON string.
 
@@ -180,6 +245,61 @@ class Frame:
         """
         self._core_frame.apply_config(config_json)
 
+    def to_bytes(self) -> bytes:
+        """Serializes the frame tree to a compact binary format.
+
+        Holds the same information as `to_json`, but is smaller and faster to create and apply.
+
+        Returns:
+            The binary representation of the tree.
+
+        Raises:
+            ValueError: On serialization failure.
+        """
+        return self._core_frame.to_bytes()
+
+    def apply_config_bytes(self, config_bytes: bytes) -> None:
+        """Applies a binary config created by `to_bytes` to update matching transforms in the tree.
+
+        Behaves like `apply_config`. It is assumed this frame is the root.
+
+        Args:
+            config_bytes: The binary config to apply.
+
+        Raises:
+            ValueError: On invalid data or mismatch errors (e.g. if this frame is not the root).
+        """
+        self._core_frame.apply_config_bytes(config_bytes)
+
+    def apply_config_arrays(
+        self,
+        names: Sequence[str],
+        parent_ids: npt.ArrayLike,
+        positions: npt.ArrayLike,
+        quaternions: npt.ArrayLike,
+    ) -> None:
+        """Applies a config given as flat arrays to update matching transforms in the tree.
+
+        Each row describes one frame and must follow the row of its parent. The first row describes
+        this frame and has the parent index -1. Behaves like `apply_config`, but updates the whole
+        tree with a single call into the core library.
+
+        Args:
+            names: The frame names.
+            parent_ids: The row index of each frame's parent as array of shape (N,).
+            positions: The positions as array of shape (N, 3).
+            quaternions: The orientations as array of shape (N, 4) in (x, y, z, w) order.
+
+        Raises:
+            ValueError: On invalid arrays or mismatch errors (e.g. if this frame is not the root).
+        """
+        self._core_frame.apply_config_arrays(
+            list(names),
+            as_indices(parent_ids),
+            as_rows(positions, 3),
+            as_rows(quaternions, 4),
+        )
+
     def parent(self) -> Frame | None:
         """Returns the parent of the frame.
 
@@ -218,19 +338,16 @@ class Frame:
         return Frame._from_rust(self._core_frame * lazy_access.inner)
 
     def __str__(self) -> str:
-        return self._core_frame.__str__()
+        return str(self._core_frame)
 
     def __repr__(self) -> str:
-        return self._core_frame.__repr__()
-
-    @property
-    def _binding_structure(self) -> Any:
-        return self._core_frame
+        return repr(self._core_frame)
 
     @classmethod
     def _from_rust(cls, rust_frame: _core.Frame) -> Frame:
         instance = cls.__new__(cls)
         instance._core_frame = rust_frame
+        instance._binding_structure = rust_frame
         return instance
 
 
@@ -238,6 +355,7 @@ class Pose:
     """Defines a Cartesian pose."""
 
     _core_pose: _core.Pose
+    _binding_structure: _core.Pose
 
     def frame(self) -> Frame:
         """Returns the frame of the pose."""
@@ -251,7 +369,7 @@ class Pose:
         """
         binding_position, binding_rotation = self._core_pose.transformation()
         return (
-            Vector3(*binding_position.to_tuple()),
+            Vector3._from_rust(binding_position),
             Rotation._from_rust(binding_rotation),
         )
 
@@ -259,7 +377,7 @@ class Pose:
     def position(self) -> Vector3:
         """The position of the pose."""
         binding_position = self._core_pose.position
-        return Vector3(*binding_position.to_tuple())
+        return Vector3._from_rust(binding_position)
 
     @property
     def orientation(self) -> Rotation:
@@ -309,14 +427,11 @@ class Pose:
         binding_pose = self._core_pose.in_frame(target_frame._binding_structure)
         return Pose._from_rust(binding_pose)
 
-    @property
-    def _binding_structure(self) -> Any:
-        return self._core_pose
-
     @classmethod
     def _from_rust(cls, rust_pose: _core.Pose) -> Pose:
         instance = cls.__new__(cls)
         instance._core_pose = rust_pose
+        instance._binding_structure = rust_pose
         return instance
 
     def __add__(self, lazy_access: LazyTranslation) -> Pose:
@@ -329,7 +444,7 @@ class Pose:
         return Pose._from_rust(self._core_pose * lazy_access.inner)
 
     def __str__(self) -> str:
-        return self._core_pose.__str__()
+        return str(self._core_pose)
 
     def __repr__(self) -> str:
-        return self._core_pose.__repr__()
+        return repr(self._core_pose)
@@ -2,12 +2,27 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+from ._arrays import as_rows, to_array
 from cartesian_tree import _cartesian_tree as _core  # type: ignore[attr-defined]
 
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+    from .base_types import Rotation
+
 
 class Quaternion:
     """Defines a quaternion."""
 
+    __slots__ = ("__weakref__", "_core_rotation", "_rotation_cache", "_values_cache")
+
+    _core_rotation: _core.Rotation
+    _rotation_cache: Rotation | None
+    _values_cache: tuple[float, float, float, float] | None
+
     def __init__(self, x: float, y: float, z: float, w: float) -> None:
         """Initializes the quaternion.
 
@@ -20,33 +35,103 @@ class Quaternion:
             w: The w value.
         """
         self._core_rotation = _core.Rotation.from_quaternion(x, y, z, w)
+        self._values_cache = None
+        self._rotation_cache = None
+
+    @property
+    def _values(self) -> tuple[float, float, float, float]:
+        """The components, read from the core library on first access."""
+        if self._values_cache is None:
+            self._values_cache = self._core_rotation.as_quaternion()
+        return self._values_cache
 
     @classmethod
     def identity(cls) -> Quaternion:
         """Initializes the identity quaternion."""
-        instance = cls.__new__(cls)
-        instance._core_rotation = _core.Rotation.identity()
-        return instance
+        return cls._from_rust(_core.Rotation.identity())
+
+    @classmethod
+    def from_rpy(cls, roll: float, pitch: float, yaw: float) -> Quaternion:
+        """Initializes the quaternion from RPY values.
+
+        The conversion happens once in the core library, which is cheaper than
+        `Rotation.from_rpy(...).as_quaternion()`.
+
+        Args:
+            roll: The roll angle in radians.
+            pitch: The pitch angle in radians.
+            yaw: The yaw angle in radians.
+
+        Returns:
+            The initialized instance.
+        """
+        return cls._from_rust(_core.Rotation.quaternion_from_rpy(roll, pitch, yaw))
+
+    @staticmethod
+    def normalize_batch(quaternions: npt.ArrayLike) -> npt.NDArray[np.float64]:
+        """Normalizes a batch of quaternions with a single call into the core library.
+
+        Args:
+            quaternions: The quaternions as array of shape (N, 4) in the form x, y, z and w.
+
+        Returns:
+            The normalized quaternions as array of shape (N, 4).
+
+        Raises:
+            ValueError: If the values are not of shape (N, 4).
+        """
+        return _core.Rotation.normalize_quaternion_batch(as_rows(quaternions, 4))
+
+    @staticmethod
+    def mul_batch(lhs: npt.ArrayLike, rhs: npt.ArrayLike) -> npt.NDArray[np.float64]:
+        """Multiplies two batches of quaternions pairwise with a single call into the core library.
+
+        Args:
+            lhs: The left factors as array of shape (N, 4) in the form x, y, z and w.
+            rhs: The right factors as array of shape (N, 4) in the form x, y, z and w.
+
+        Returns:
+            The Hamilton products as array of shape (N, 4).
+
+        Raises:
+            ValueError: If the values are not of shape (N, 4) or the batches differ in length.
+        """
+        return _core.Rotation.multiply_quaternion_batch(as_rows(lhs, 4), as_rows(rhs, 4))
+
+    @staticmethod
+    def to_matrix_batch(quaternions: npt.ArrayLike) -> npt.NDArray[np.float64]:
+        """Converts a batch of quaternions to rotation matrices with a single call into the core library.
+
+        Args:
+            quaternions: The unit quaternions as array of shape (N, 4) in the form x, y, z and w.
+
+        Returns:
+            The rotation matrices as array of shape (N, 3, 3).
+
+        Raises:
+            ValueError: If the values are not of shape (N, 4).
+        """
+        return _core.Rotation.to_matrix_batch(as_rows(quaternions, 4))
 
     @property
     def x(self) -> float:
         """The x value."""
-        return self._core_rotation.as_quaternion()[0]
+        return self._values[0]
 
     @property
     def y(self) -> float:
         """The y value."""
-        return self._core_rotation.as_quaternion()[1]
+        return self._values[1]
 
     @property
     def z(self) -> float:
         """The z value."""
-        return self._core_rotation.as_quaternion()[2]
+        return self._values[2]
 
     @property
     def w(self) -> float:
         """The w value."""
-        return self._core_rotation.as_quaternion()[3]
+        return self._values[3]
 
     def vector_part(self) -> tuple[float, float, float]:
         """Returns the vector part of the quaternion.
@@ -54,7 +139,7 @@ class Quaternion:
         Returns:
             The vector part of the quaternion.
         """
-        return self._core_rotation.as_quaternion()[0:3]
+        return self._values[0:3]
 
     def as_list(self) -> list[float]:
         """Returns the quaternion as list in the form x,y,z and w.
@@ -62,7 +147,7 @@ class Quaternion:
         Returns:
             The quaternion as list.
         """
-        return list(self._core_rotation.as_quaternion())
+        return list(self._values)
 
     def as_tuple(self) -> tuple[float, float, float, float]:
         """Returns the quaternion as tuple in the form x,y,z and w.
@@ -70,16 +155,41 @@ class Quaternion:
         Returns:
             The quaternion as tuple.
         """
-        return self._core_rotation.as_quaternion()
+        return self._values
+
+    def as_array(self) -> npt.NDArray[np.float64]:
+        """Returns the quaternion as array in the form x,y,z and w.
+
+        Returns:
+            The quaternion as array of shape (4,).
+        """
+        return to_array(self._values)
+
+    def to_rotation(self) -> Rotation:
+        """Converts the quaternion to a rotation.
+
+        The rotation is created on the first call and reused afterwards.
+
+        Returns:
+            The rotation.
+        """
+        if self._rotation_cache is None:
+            # Imported here, as base_types imports this module.
+            from .base_types import Rotation  # noqa: PLC0415
+
+            self._rotation_cache = Rotation._from_rust(self._core_rotation)
+        return self._rotation_cache
 
     @classmethod
     def _from_rust(cls, rust_rotation: _core.Rotation) -> Quaternion:
         instance = cls.__new__(cls)
         instance._core_rotation = rust_rotation
+        instance._values_cache = None
+        instance._rotation_cache = None
         return instance
 
     def __str__(self) -> str:
-        x, y, z, w = self._core_rotation.as_quaternion()
+        x, y, z, w = self._values
         return f"(<{x}, {y}, {z}>, {w})"
 
     def __repr__(self) -> str:
@@ -0,0 +1,22 @@
+"""Contains fixtures shared by the tests."""
+
+from math import radians
+
+import pytest
+
+from cartesian_tree import Quaternion, Rotation
+
+
+@pytest.fixture(scope="session")
+def identity_quat() -> Quaternion:
+    return Quaternion(0.0, 0.0, 0.0, 1.0)
+
+
+@pytest.fixture(scope="session")
+def identity_rot(identity_quat: Quaternion) -> Rotation:
+    return identity_quat.to_rotation()
+
+
+@pytest.fixture(scope="session")
+def yaw90_rot() -> Rotation:
+    return Rotation.from_rpy(0.0, 0.0, radians(90))
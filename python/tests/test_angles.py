@@ -1,6 +1,10 @@
 """Contains tests for the angles module."""
 
-from cartesian_tree import RPY
+from math import radians
+
+import pytest
+
+from cartesian_tree import RPY, Quaternion
 
 
 def test_rpy_properties() -> None:
@@ -18,13 +22,42 @@ def test_rpy_identity() -> None:
     assert identity.yaw == 0.0
 
 
+def test_rpy_from_quaternion() -> None:
+    rpy = RPY.from_quaternion(0.0, 0.0, 0.7071, 0.7071)
+    assert rpy.as_tuple() == pytest.approx((0.0, 0.0, radians(90.0)), abs=1e-5)
+
+
 def test_rpy_as_list() -> None:
     rpy = RPY(1.0, 2.0, 3.0)
     rpy_list = rpy.as_list()
     assert isinstance(rpy_list, list)
+    assert rpy_list == [1.0, 2.0, 3.0]
 
 
 def test_rpy_as_tuple() -> None:
     rpy = RPY(1.0, 2.0, 3.0)
     rpy_tuple = rpy.as_tuple()
     assert isinstance(rpy_tuple, tuple)
+    assert rpy_tuple == (1.0, 2.0, 3.0)
+
+
+def test_rpy_as_tuple_is_cached() -> None:
+    rpy = RPY(0.1, 0.2, 0.3)
+    assert rpy.as_tuple() is rpy.as_tuple()
+    assert rpy.as_list() == list(rpy.as_tuple())
+    assert rpy.as_list() is not rpy.as_list()
+
+
+def test_rpy_as_array() -> None:
+    rpy = RPY(1.0, 0.5, 3.0)
+    rpy_array = rpy.as_array()
+    assert rpy_array.shape == (3,)
+    assert tuple(rpy_array) == pytest.approx((1.0, 0.5, 3.0), abs=1e-10)
+
+
+def test_rpy_to_rotation() -> None:
+    rpy = RPY(0.1, 0.2, 0.3)
+    rotation = rpy.to_rotation()
+    assert rotation is rpy.to_rotation()
+    assert rotation.as_rpy().as_tuple() == pytest.approx(rpy.as_tuple())
+    assert rotation.as_quaternion().as_tuple() == pytest.approx(Quaternion.from_rpy(0.1, 0.2, 0.3).as_tuple())
@@ -1,10 +1,12 @@
 """Contains tests for the base types."""
 
+import weakref
 from math import radians
 
+import numpy as np
 import pytest
 
-from cartesian_tree import Isometry, Rotation, Vector3
+from cartesian_tree import Isometry, Rotation, Vector3, Vector3Array
 
 
 def test_vector3_properties() -> None:
@@ -19,12 +21,51 @@ def test_vector3_as_list() -> None:
     v = Vector3(1.0, 2.0, 3.0)
     v_list = v.as_list()
     assert isinstance(v_list, list)
+    assert v_list == [1.0, 2.0, 3.0]
 
 
 def test_vector3_as_tuple() -> None:
     v = Vector3(1.0, 2.0, 3.0)
     v_tuple = v.as_tuple()
     assert isinstance(v_tuple, tuple)
+    assert v_tuple == (1.0, 2.0, 3.0)
+
+
+def test_vector3_as_tuple_is_cached() -> None:
+    v = Vector3(1.0, 2.0, 3.0)
+    assert v.as_tuple() is v.as_tuple()
+    assert v.as_list() == list(v.as_tuple())
+    assert v.as_list() is not v.as_list()
+
+
+def test_vector3_as_array() -> None:
+    v = Vector3(1.0, 2.0, 3.0)
+    v_array = v.as_array()
+    assert v_array.shape == (3,)
+    assert tuple(v_array) == (1.0, 2.0, 3.0)
+
+
+def test_vector3_normalize() -> None:
+    assert Vector3(3.0, 0.0, 4.0).normalize().as_tuple() == pytest.approx((0.6, 0.0, 0.8))
+    assert Vector3(1e-17, 0.0, 0.0).normalize().as_tuple() == pytest.approx((1.0, 0.0, 0.0))
+    with pytest.raises(ValueError, match="zero or non-finite length"):
+        Vector3(0.0, 0.0, 0.0).normalize()
+    with pytest.raises(ValueError, match="zero or non-finite length"):
+        Vector3(float("inf"), 0.0, 0.0).normalize()
+
+
+def test_vector3_array() -> None:
+    vectors = Vector3Array(np.array([[1.0, 0.0, 0.0], [1.0, 2.0, 3.0]]))
+
+    assert len(vectors) == 2
+    assert vectors[1].as_tuple() == pytest.approx((1.0, 2.0, 3.0))
+    assert vectors[-1].as_tuple() == pytest.approx((1.0, 2.0, 3.0))
+    with pytest.raises(IndexError):
+        vectors[2]
+
+    rotated = vectors.rotate(Rotation.from_rpy(0.0, 0.0, radians(90.0)))
+    np.testing.assert_allclose(rotated.as_array(), [[0.0, 1.0, 0.0], [-2.0, 1.0, 3.0]], atol=1e-10)
+    np.testing.assert_allclose(vectors.as_array(), [[1.0, 0.0, 0.0], [1.0, 2.0, 3.0]])
 
 
 def test_rotation_from_rpy() -> None:
@@ -47,6 +88,88 @@ def test_rotation_identity() -> None:
     assert identity.as_quaternion().as_tuple() == pytest.approx((0.0, 0.0, 0.0, 1.0), abs=1e-5)
 
 
+def test_rotation_from_rpy_batch() -> None:
+    rpy = np.array([[1.0, 0.5, 3.0], [0.0, 0.0, radians(90.0)]])
+
+    quaternions = Rotation.from_rpy_batch(rpy)
+
+    assert quaternions.shape == (2, 4)
+    expected = [Rotation.from_rpy(*angles).as_quaternion().as_tuple() for angles in rpy]
+    np.testing.assert_allclose(quaternions, expected, atol=1e-10)
+
+
+def test_rotation_to_rpy_batch() -> None:
+    rpy = [[0.1, 0.2, 0.3], [-1.0, 0.5, 2.5], [0.0, 0.0, 0.0]]
+
+    converted = Rotation.to_rpy_batch(Rotation.from_rpy_batch(rpy))
+
+    assert converted.shape == (3, 3)
+    np.testing.assert_allclose(converted, rpy, atol=1e-10)
+
+
+def test_rotation_apply_batch() -> None:
+    rotation = Rotation.from_rpy(0.0, 0.0, radians(90.0))
+    points = np.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [1.0, 2.0, 3.0]])
+
+    rotated = rotation.apply_batch(points)
+
+    assert rotated.shape == (3, 3)
+    np.testing.assert_allclose(rotated, [[0.0, 1.0, 0.0], [-1.0, 0.0, 0.0], [-2.0, 1.0, 3.0]], atol=1e-10)
+
+    with pytest.raises(ValueError, match="shape"):
+        rotation.apply_batch(np.zeros((2, 4)))
+
+
+def test_rotation_compose_batch() -> None:
+    rotation = Rotation.from_rpy(0.0, 0.0, radians(90.0))
+    quaternions = Rotation.from_rpy_batch([[0.0, 0.0, radians(90.0)], [0.0, 0.0, 0.0]])
+
+    composed = rotation.compose_batch(quaternions)
+
+    assert composed.shape == (2, 4)
+    half_turn = Rotation.from_rpy(0.0, 0.0, radians(180.0))
+    np.testing.assert_allclose(composed[0], half_turn.as_quaternion().as_array(), atol=1e-10)
+    np.testing.assert_allclose(composed[1], rotation.as_quaternion().as_array(), atol=1e-10)
+
+
+def test_rotation_to_matrix() -> None:
+    rotation = Rotation.from_rpy(0.1, 0.2, 0.3)
+    matrix = rotation.to_matrix()
+    assert matrix.shape == (3, 3)
+
+    points = np.arange(60.0).reshape(20, 3)
+    np.testing.assert_allclose(rotation.apply_batch(points), points @ matrix.T, atol=1e-10)
+    np.testing.assert_allclose(rotation.apply_batch(points[:3]), points[:3] @ matrix.T, atol=1e-10)
+
+
+def test_rotation_identity_is_shared() -> None:
+    assert Rotation.identity() is Rotation.IDENTITY
+    assert Rotation.from_quaternion(0.0, 0.0, 0.0, 1.0) is Rotation.IDENTITY
+    assert Rotation.from_rpy(0.0, 0.0, 0.0) is Rotation.from_rpy(0.0, 0.0, 0.0)
+    assert str(Rotation.from_rpy(0.0, 0.0, 0.0)).startswith("RPY")
+    assert Rotation.from_rpy(0.0, 0.0, 1.0) is not Rotation.IDENTITY
+
+
+def test_rotation_conversions_are_cached() -> None:
+    rotation = Rotation.from_rpy(0.1, 0.2, 0.3)
+    assert rotation.as_quaternion() is rotation.as_quaternion()
+    assert rotation.as_rpy() is rotation.as_rpy()
+
+
+def test_wrappers_support_weak_references() -> None:
+    rotation = Rotation.from_rpy(0.1, 0.2, 0.3)
+    wrappers = [
+        rotation,
+        rotation.as_quaternion(),
+        rotation.as_rpy(),
+        Vector3(1.0, 2.0, 3.0),
+        Vector3Array(np.zeros((1, 3))),
+        Isometry.identity(),
+    ]
+    for wrapper in wrappers:
+        assert weakref.ref(wrapper)() is wrapper
+
+
 def test_build_isometry() -> None:
     isometry = Isometry.identity()
     assert isometry.translation().as_tuple() == pytest.approx((0.0, 0.0, 0.0), abs=1e-5)
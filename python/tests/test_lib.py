@@ -2,6 +2,7 @@
 
 from math import pi, radians
 
+import numpy as np
 import pytest
 
 from cartesian_tree import Frame, Isometry, Pose, Rotation, Vector3, rz, y, z
@@ -14,12 +15,11 @@ def test_create_root_frame() -> None:
     assert frame.depth == 0
 
 
-def test_tree_structure() -> None:
+def test_tree_structure(identity_rot: Rotation) -> None:
     frame = Frame("root")
     position = Vector3(1.0, 2.0, 3.0)
-    orientation = Rotation.identity()
-    child = frame.add_child("child", position, orientation)
-    grandchild = child.add_child("grandchild", position, orientation)
+    child = frame.add_child("child", position, identity_rot)
+    grandchild = child.add_child("grandchild", position, identity_rot)
     assert grandchild.depth == 2
     parent = grandchild.parent()
     assert parent is not None
@@ -27,11 +27,10 @@ def test_tree_structure() -> None:
     assert grandchild.root().name == "root"
 
 
-def test_add_child_frame_with_quaternion() -> None:
+def test_add_child_frame_with_quaternion(identity_rot: Rotation) -> None:
     root = Frame("base")
     position = Vector3(1.0, 2.0, 3.0)
-    orientation = Rotation.identity()
-    child = root.add_child("child", position, orientation)
+    child = root.add_child("child", position, identity_rot)
 
     assert isinstance(child, Frame)
     assert child.name == "child"
@@ -41,6 +40,19 @@ def test_add_child_frame_with_quaternion() -> None:
     assert root.children()[0].name == "child"
 
 
+def test_add_child_frame_from_raw_values() -> None:
+    root = Frame("base")
+    child_quat = root.add_child_quat("child_quat", (1.0, 2.0, 3.0), (0.0, 0.0, 0.0, 2.0))
+    child_rpy = root.add_child_rpy("child_rpy", (1.0, 2.0, 3.0), (0.0, 0.0, radians(90.0)))
+
+    assert child_quat.position.as_tuple() == (1.0, 2.0, 3.0)
+    assert child_quat.orientation.as_quaternion().as_tuple() == pytest.approx((0.0, 0.0, 0.0, 1.0))
+    assert child_rpy.orientation.as_rpy().as_tuple() == pytest.approx((0.0, 0.0, radians(90.0)))
+    assert [child.name for child in root.children()] == ["child_quat", "child_rpy"]
+    with pytest.raises(ValueError, match="already exists"):
+        root.add_child_rpy("child_quat", (0.0, 0.0, 0.0), (0.0, 0.0, 0.0))
+
+
 def test_add_child_frame_with_rpy() -> None:
     root = Frame("world")
     position = Vector3(0.0, 0.0, 0.0)
@@ -55,18 +67,17 @@ def test_add_child_frame_with_rpy() -> None:
     assert parent.name == "world"
 
 
-def test_transformation_and_update() -> None:
+def test_transformation_and_update(identity_rot: Rotation) -> None:
     root = Frame("root")
     position = Vector3(1.0, 2.0, 3.0)
-    orientation = Rotation.identity()
-    child = root.add_child("child", position, orientation)
+    child = root.add_child("child", position, identity_rot)
 
     orig_pos, orig_quat = child.transformation()
     assert isinstance(orig_pos, Vector3)
     assert isinstance(orig_quat, Rotation)
 
-    assert child.position.as_tuple() == pytest.approx((1.0, 2.0, 3.0), abs=1e-5)
-    assert child.orientation.as_rpy().as_tuple() == pytest.approx((0.0, 0.0, 0.0), abs=1e-5)
+    np.testing.assert_allclose(child.position.as_array(), (1.0, 2.0, 3.0), atol=1e-5)
+    np.testing.assert_allclose(child.orientation.as_rpy().as_array(), (0.0, 0.0, 0.0), atol=1e-5)
 
     # Update transformation
     new_position = Vector3(5.0, 6.0, 7.0)
@@ -74,8 +85,8 @@ def test_transformation_and_update() -> None:
     child.set(new_position, new_orientation)
 
     updated_pos, updated_quat = child.transformation()
-    assert updated_pos.as_tuple() == pytest.approx((5.0, 6.0, 7.0), abs=1e-5)
-    assert updated_quat.as_quaternion().as_tuple() == pytest.approx((0.0, 0.7071, 0.0, 0.7071), abs=1e-5)
+    np.testing.assert_allclose(updated_pos.as_array(), (5.0, 6.0, 7.0), atol=1e-5)
+    np.testing.assert_allclose(updated_quat.as_quaternion().as_array(), (0.0, 0.7071, 0.0, 0.7071), atol=1e-5)
 
 
 def test_apply_in_parent_frame() -> None:
@@ -163,26 +174,25 @@ def test_pose_apply_in_local_frame() -> None:
     assert updated_rot.as_rpy().as_tuple() == pytest.approx((0.0, 0.0, radians(180)), abs=1e-5)
 
 
-def test_add_pose_and_update() -> None:
+def test_add_pose_and_update(identity_rot: Rotation) -> None:
     root = Frame("base")
     position = Vector3(1.0, 2.0, 3.0)
-    orientation = Rotation.identity()
-    pose = root.add_pose(position, orientation)
+    pose = root.add_pose(position, identity_rot)
 
     assert isinstance(pose, Pose)
     p_position, p_orientation = pose.transformation()
-    assert p_position.as_tuple() == pytest.approx((1.0, 2.0, 3.0), abs=1e-5)
-    assert p_orientation.as_quaternion().as_tuple() == pytest.approx((0.0, 0.0, 0.0, 1.0), abs=1e-5)
+    np.testing.assert_allclose(p_position.as_array(), (1.0, 2.0, 3.0), atol=1e-5)
+    np.testing.assert_allclose(p_orientation.as_quaternion().as_array(), (0.0, 0.0, 0.0, 1.0), atol=1e-5)
 
-    assert pose.position.as_tuple() == pytest.approx((1.0, 2.0, 3.0), abs=1e-5)
-    assert pose.orientation.as_rpy().as_tuple() == pytest.approx((0.0, 0.0, 0.0), abs=1e-5)
+    np.testing.assert_allclose(pose.position.as_array(), (1.0, 2.0, 3.0), atol=1e-5)
+    np.testing.assert_allclose(pose.orientation.as_rpy().as_array(), (0.0, 0.0, 0.0), atol=1e-5)
 
     # Update the pose
     new_position = Vector3(4.0, 5.0, 6.0)
     new_orientation = Rotation.from_rpy(0.0, 0.0, 0.0)
     pose.set(new_position, new_orientation)
     up_pos, _ = pose.transformation()
-    assert up_pos.as_tuple() == pytest.approx((4.0, 5.0, 6.0), abs=1e-5)
+    np.testing.assert_allclose(up_pos.as_array(), (4.0, 5.0, 6.0), atol=1e-5)
 
     # Access frame
     frame_of_pose = pose.frame()
@@ -191,18 +201,18 @@ def test_add_pose_and_update() -> None:
     assert len(frame_of_pose.children()) == 1
 
 
-def test_pose_in_frame() -> None:
+def test_pose_in_frame(identity_rot: Rotation, yaw90_rot: Rotation) -> None:
     base = Frame("base")
-    frame_1 = base.add_child("frame1", Vector3(1, 1, 1), Rotation.identity())
-    frame_2 = base.add_child("frame2", Vector3(-2, 0, 0), Rotation.from_rpy(0, 0, radians(90)))
+    frame_1 = base.add_child("frame1", Vector3(1, 1, 1), identity_rot)
+    frame_2 = base.add_child("frame2", Vector3(-2, 0, 0), yaw90_rot)
 
-    pose_in_frame1 = frame_1.add_pose(Vector3(0, 0, 0), Rotation.identity())
+    pose_in_frame1 = frame_1.add_pose(Vector3(0, 0, 0), identity_rot)
     transformed_pose = pose_in_frame1.in_frame(frame_2)
 
     pos, quat = transformed_pose.transformation()
 
-    assert pos.as_tuple() == pytest.approx((1.0, -3.0, 1.0), abs=1e-5)
-    assert quat.as_rpy().as_tuple() == pytest.approx((0.0, 0.0, -radians(90)), abs=1e-5)
+    np.testing.assert_allclose(pos.as_array(), (1.0, -3.0, 1.0), atol=1e-5)
+    np.testing.assert_allclose(quat.as_rpy().as_array(), (0.0, 0.0, -radians(90)), atol=1e-5)
 
 
 def test_calibrate_frame() -> None:
@@ -214,28 +224,95 @@ def test_calibrate_frame() -> None:
 
     pos, quat = calibrated_frame.transformation()
 
-    assert pos.as_tuple() == pytest.approx((2.0, 2.0, 2.0), abs=1e-5)
-    assert quat.as_quaternion().as_tuple() == pytest.approx((0.0, 0.0, 0.0, 1.0), abs=1e-5)
+    np.testing.assert_allclose(pos.as_array(), (2.0, 2.0, 2.0), atol=1e-5)
+    np.testing.assert_allclose(quat.as_quaternion().as_array(), (0.0, 0.0, 0.0, 1.0), atol=1e-5)
 
 
-def test_serialization() -> None:
+def test_serialization(identity_rot: Rotation, yaw90_rot: Rotation) -> None:
     root = Frame("root")
-    child1 = root.add_child("child1", Vector3(1, 0, 0), Rotation.identity())
-    child2 = child1.add_child("child2", Vector3(0, 1, 0), Rotation.from_rpy(0, 0, radians(90)))
-    child2.add_pose(Vector3(0, 0, 1), Rotation.identity())
+    child1 = root.add_child("child1", Vector3(1, 0, 0), identity_rot)
+    child2 = child1.add_child("child2", Vector3(0, 1, 0), yaw90_rot)
+    child2.add_pose(Vector3(0, 0, 1), identity_rot)
 
     json_str = root.to_json()
 
     default_root = Frame("root")
-    default_child1 = default_root.add_child("child1", Vector3(2, 0, 0), Rotation.identity())
-    default_child2 = default_child1.add_child("child2", Vector3(0, 2, 0), Rotation.from_rpy(0, 0, radians(90)))
+    default_child1 = default_root.add_child("child1", Vector3(2, 0, 0), identity_rot)
+    default_child2 = default_child1.add_child("child2", Vector3(0, 2, 0), yaw90_rot)
 
     default_root.apply_config(json_str)
 
     position, _ = default_child1.transformation()
-    assert position.as_tuple() == pytest.approx((1.0, 0.0, 0.0), abs=1e-5)  # Updated back to '1'
+    np.testing.assert_allclose(position.as_array(), (1.0, 0.0, 0.0), atol=1e-5)  # Updated back to '1'
     position, _ = default_child2.transformation()
-    assert position.as_tuple() == pytest.approx((0.0, 1.0, 0.0), abs=1e-5)  # Updated back to '1'
+    np.testing.assert_allclose(position.as_array(), (0.0, 1.0, 0.0), atol=1e-5)  # Updated back to '1'
+
+
+def test_transform_points() -> None:
+    root = Frame("root")
+    child = root.add_child("child", Vector3(1.0, 0.0, 0.0), Rotation.from_rpy(0.0, 0.0, radians(90)))
+    other = root.add_child("other", Vector3(0.0, 2.0, 0.0), Rotation.identity())
+    points = [[1.0, 0.0, 0.0], [0.0, 0.0, 1.0]]
+
+    in_root = child.transform_points(points, root)
+    in_other = child.transform_points(points, other)
+
+    assert in_root.shape == (2, 3)
+    assert in_root.ravel().tolist() == pytest.approx([1.0, 1.0, 0.0, 1.0, 0.0, 1.0])
+    assert in_other.ravel().tolist() == pytest.approx([1.0, -1.0, 0.0, 1.0, -2.0, 1.0])
+    pose_in_other = child.add_pose(Vector3(1.0, 0.0, 0.0), Rotation.identity()).in_frame(other)
+    assert pose_in_other.position.as_tuple() == pytest.approx(tuple(in_other[0]))
+    with pytest.raises(ValueError, match="common ancestor"):
+        child.transform_points(points, Frame("unrelated"))
+
+
+def test_binary_serialization() -> None:
+    root = Frame("root")
+    child1 = root.add_child("child1", Vector3(1, 0, 0), Rotation.identity())
+    child1.add_child("child2", Vector3(0, 1, 0), Rotation.from_rpy(0, 0, radians(90)))
+
+    config = root.to_bytes()
+
+    default_root = Frame("root")
+    default_child1 = default_root.add_child("child1", Vector3(2, 0, 0), Rotation.identity())
+    default_child2 = default_child1.add_child("child2", Vector3(0, 2, 0), Rotation.identity())
+
+    default_root.apply_config_bytes(config)
+
+    position, _ = default_child1.transformation()
+    assert position.as_tuple() == pytest.approx((1.0, 0.0, 0.0))
+    position, rotation = default_child2.transformation()
+    assert position.as_tuple() == pytest.approx((0.0, 1.0, 0.0))
+    assert rotation.as_rpy().as_tuple() == pytest.approx((0.0, 0.0, radians(90)))
+
+    with pytest.raises(ValueError, match="Invalid binary config"):
+        default_root.apply_config_bytes(config[:-1])
+    with pytest.raises(ValueError, match="mismatch"):
+        Frame("other").apply_config_bytes(config)
+
+
+def test_apply_config_arrays() -> None:
+    root = Frame("root")
+    child1 = root.add_child("child1", Vector3(2, 0, 0), Rotation.identity())
+    child2 = child1.add_child("child2", Vector3(0, 2, 0), Rotation.identity())
+
+    root.apply_config_arrays(
+        ["root", "child1", "child2"],
+        [-1, 0, 1],
+        [[0, 0, 0], [1, 0, 0], [0, 1, 0]],
+        [[0, 0, 0, 1], [0, 0, 0, 2], [0, 0, 1, 1]],
+    )
+
+    position, _ = child1.transformation()
+    assert position.as_tuple() == pytest.approx((1.0, 0.0, 0.0))
+    position, rotation = child2.transformation()
+    assert position.as_tuple() == pytest.approx((0.0, 1.0, 0.0))
+    assert rotation.as_rpy().as_tuple() == pytest.approx((0.0, 0.0, radians(90)))
+
+    with pytest.raises(ValueError, match="Invalid parent index"):
+        root.apply_config_arrays(["root", "child1"], [-1, 1], np.zeros((2, 3)), np.zeros((2, 4)))
+    with pytest.raises(ValueError, match="shape"):
+        root.apply_config_arrays(["root"], [-1], np.zeros((1, 2)), np.zeros((1, 4)))
 
 
 def test_lazy_translation_frame() -> None:
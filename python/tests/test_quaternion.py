@@ -1,5 +1,7 @@
 """Contains tests for the quaternion module."""
 
+from math import radians
+
 import pytest
 
 from cartesian_tree import Quaternion
@@ -22,6 +24,11 @@ def test_quaternion_identity() -> None:
     assert identity.w == 1.0
 
 
+def test_quaternion_from_rpy() -> None:
+    q = Quaternion.from_rpy(0.0, 0.0, radians(90.0))
+    assert q.as_tuple() == pytest.approx((0.0, 0.0, 0.7071, 0.7071), abs=1e-4)
+
+
 def test_quaternion_vector_part() -> None:
     q = Quaternion(0.0, 0.0, 0.707, 0.707)
     vector = q.vector_part()
@@ -38,3 +45,55 @@ def test_quaternion_as_tuple() -> None:
     q = Quaternion(1.0, 2.0, 3.0, 4.0)
     q_tuple = q.as_tuple()
     assert isinstance(q_tuple, tuple)
+
+
+def test_quaternion_as_tuple_is_cached() -> None:
+    q = Quaternion(0.0, 0.0, 0.707, 0.707)
+    assert q.as_tuple() is q.as_tuple()
+    assert q.as_list() == list(q.as_tuple())
+    assert q.as_list() is not q.as_list()
+
+
+def test_quaternion_as_array() -> None:
+    q = Quaternion(0.0, 0.0, 0.707, 0.707)
+    q_array = q.as_array()
+    assert q_array.shape == (4,)
+    assert tuple(q_array) == pytest.approx(q.as_tuple())
+
+
+def test_quaternion_normalize_batch() -> None:
+    normalized = Quaternion.normalize_batch([[0.0, 0.0, 0.707, 0.707], [0.0, 0.0, 0.0, 2.0]])
+    assert normalized.shape == (2, 4)
+    assert tuple(normalized[0]) == pytest.approx(Quaternion(0.0, 0.0, 0.707, 0.707).as_tuple())
+    assert tuple(normalized[1]) == pytest.approx((0.0, 0.0, 0.0, 1.0))
+
+
+def test_quaternion_mul_batch() -> None:
+    half = 0.5**0.5
+    lhs = [[0.0, 0.0, half, half], [0.0, 0.0, 0.0, 1.0]]
+    rhs = [[0.0, 0.0, half, half], [1.0, 0.0, 0.0, 0.0]]
+
+    products = Quaternion.mul_batch(lhs, rhs)
+
+    assert products.shape == (2, 4)
+    assert tuple(products[0]) == pytest.approx((0.0, 0.0, 1.0, 0.0))
+    assert tuple(products[1]) == pytest.approx((1.0, 0.0, 0.0, 0.0))
+    with pytest.raises(ValueError, match="same length"):
+        Quaternion.mul_batch(lhs, rhs[:1])
+
+
+def test_quaternion_to_matrix_batch() -> None:
+    half = 0.5**0.5
+    matrices = Quaternion.to_matrix_batch([[0.0, 0.0, half, half], [0.0, 0.0, 0.0, 1.0]])
+
+    assert matrices.shape == (2, 3, 3)
+    assert matrices[0].ravel().tolist() == pytest.approx([0.0, -1.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0])
+    assert matrices[1].ravel().tolist() == pytest.approx([1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0])
+
+
+def test_quaternion_to_rotation() -> None:
+    q = Quaternion(0.0, 0.0, 0.707, 0.707)
+    rotation = q.to_rotation()
+    assert rotation is q.to_rotation()
+    assert rotation.as_quaternion() is rotation.as_quaternion()
+    assert rotation.as_quaternion().as_tuple() == pytest.approx(q.as_tuple())
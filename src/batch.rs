@@ -0,0 +1,670 @@
+//! Batched kernels.
+//!
+//! The kernels operate on flat, row-major buffers (e.g. `[x0, y0, z0, x1, y1, z1, ...]` for
+//! points) so that whole arrays can be processed with a single call. On x86-64 every kernel is
+//! additionally compiled with AVX2 and FMA, which is used if the CPU supports it.
+// Plain multiply-adds are kept on purpose: `f64::mul_add` becomes a libm call on targets without FMA.
+#![allow(clippy::suboptimal_flops)]
+
+use nalgebra::{Isometry3, Matrix3, UnitQuaternion};
+use std::f64::consts::FRAC_PI_2;
+use std::sync::OnceLock;
+
+/// Defines a batch kernel that is compiled once more with AVX2 and FMA enabled.
+///
+/// The variant to use is selected on the first call by checking the CPU at runtime, so the same
+/// binary runs on CPUs without these extensions.
+macro_rules! multiversion {
+    (
+        $(#[$meta:meta])*
+        $vis:vis fn $name:ident($($arg:ident: $ty:ty),* $(,)?) -> $ret:ty $body:block
+    ) => {
+        $(#[$meta])*
+        $vis fn $name($($arg: $ty),*) -> $ret {
+            type Kernel = unsafe fn($($ty),*) -> $ret;
+
+            // Always inlined, so that each variant compiles the body with its own features.
+            #[allow(clippy::inline_always)]
+            #[inline(always)]
+            fn kernel($($arg: $ty),*) -> $ret $body
+
+            #[cfg(target_arch = "x86_64")]
+            #[target_feature(enable = "avx2,fma")]
+            unsafe fn kernel_avx2_fma($($arg: $ty),*) -> $ret {
+                kernel($($arg),*)
+            }
+
+            static SELECTED: OnceLock<Kernel> = OnceLock::new();
+            let selected = SELECTED.get_or_init(|| -> Kernel {
+                #[cfg(target_arch = "x86_64")]
+                if std::is_x86_feature_detected!("avx2") && std::is_x86_feature_detected!("fma") {
+                    return kernel_avx2_fma;
+                }
+                kernel
+            });
+            // SAFETY: The AVX2/FMA variant is only selected if the CPU supports both features.
+            unsafe { selected($($arg),*) }
+        }
+    };
+}
+
+multiversion! {
+    /// Rotates a batch of points.
+    ///
+    /// # Arguments
+    /// - `rotation`: The rotation to apply.
+    /// - `points`: The points as row-major buffer of `[x, y, z]` rows.
+    ///
+    /// # Returns
+    /// The rotated points in the same layout.
+    ///
+    /// # Panics
+    /// Panics if the length of `points` is not a multiple of three.
+    ///
+    /// # Example
+    /// ```
+    /// use cartesian_tree::batch::rotate_points;
+    /// use nalgebra::UnitQuaternion;
+    ///
+    /// let rotation = UnitQuaternion::from_euler_angles(0.0, 0.0, std::f64::consts::FRAC_PI_2);
+    /// let rotated = rotate_points(&rotation, &[1.0, 0.0, 0.0, 0.0, 1.0, 0.0]);
+    /// ```
+    #[must_use]
+    pub fn rotate_points(rotation: &UnitQuaternion<f64>, points: &[f64]) -> Vec<f64> {
+        assert_eq!(points.len() % 3, 0, "points must consist of [x, y, z] rows");
+        if is_identity(rotation) {
+            return points.to_vec();
+        }
+        let (qx, qy, qz, qw) = (rotation.i, rotation.j, rotation.k, rotation.w);
+        let mut rotated = vec![0.0; points.len()];
+
+        // v' = v + w * t + u x t with t = 2 * (u x v)
+        for (point, out) in points.chunks_exact(3).zip(rotated.chunks_exact_mut(3)) {
+            let (px, py, pz) = (point[0], point[1], point[2]);
+            let tx = 2.0 * (qy * pz - qz * py);
+            let ty = 2.0 * (qz * px - qx * pz);
+            let tz = 2.0 * (qx * py - qy * px);
+            out[0] = px + qw * tx + (qy * tz - qz * ty);
+            out[1] = py + qw * ty + (qz * tx - qx * tz);
+            out[2] = pz + qw * tz + (qx * ty - qy * tx);
+        }
+        rotated
+    }
+}
+
+multiversion! {
+    /// Rotates a batch of points by a rotation matrix.
+    ///
+    /// Costs 9 multiplications per point instead of the 15 of [`rotate_points`], which pays off once
+    /// the matrix is reused for enough points.
+    ///
+    /// # Arguments
+    /// - `matrix`: The rotation matrix to apply.
+    /// - `points`: The points as row-major buffer of `[x, y, z]` rows.
+    ///
+    /// # Returns
+    /// The rotated points in the same layout.
+    ///
+    /// # Panics
+    /// Panics if the length of `points` is not a multiple of three.
+    #[must_use]
+    pub fn rotate_points_matrix(matrix: &Matrix3<f64>, points: &[f64]) -> Vec<f64> {
+        assert_eq!(points.len() % 3, 0, "points must consist of [x, y, z] rows");
+        if matrix.is_identity(0.0) {
+            return points.to_vec();
+        }
+        let m = matrix;
+        let mut rotated = vec![0.0; points.len()];
+
+        for (point, out) in points.chunks_exact(3).zip(rotated.chunks_exact_mut(3)) {
+            let (px, py, pz) = (point[0], point[1], point[2]);
+            out[0] = m[(0, 0)] * px + m[(0, 1)] * py + m[(0, 2)] * pz;
+            out[1] = m[(1, 0)] * px + m[(1, 1)] * py + m[(1, 2)] * pz;
+            out[2] = m[(2, 0)] * px + m[(2, 1)] * py + m[(2, 2)] * pz;
+        }
+        rotated
+    }
+}
+
+multiversion! {
+    /// Converts a batch of unit quaternions to roll-pitch-yaw angles.
+    ///
+    /// Uses the same convention as [`UnitQuaternion::euler_angles`]. Both the regular and the
+    /// gimbal-lock solution are computed for every row and the valid one is selected afterwards, so
+    /// mixed batches do not cause branch mispredictions.
+    ///
+    /// # Arguments
+    /// - `quaternions`: The unit quaternions as row-major buffer of `[x, y, z, w]` rows.
+    ///
+    /// # Returns
+    /// The angles in radians as row-major buffer of `[roll, pitch, yaw]` rows.
+    ///
+    /// # Panics
+    /// Panics if the length of `quaternions` is not a multiple of four.
+    #[must_use]
+    pub fn quaternions_to_rpy(quaternions: &[f64]) -> Vec<f64> {
+        assert_eq!(
+            quaternions.len() % 4,
+            0,
+            "quaternions must consist of [x, y, z, w] rows"
+        );
+        let mut rpy = vec![0.0; quaternions.len() / 4 * 3];
+
+        for (quat, out) in quaternions.chunks_exact(4).zip(rpy.chunks_exact_mut(3)) {
+            let (x, y, z, w) = (quat[0], quat[1], quat[2], quat[3]);
+            let m00 = 1.0 - 2.0 * (y * y + z * z);
+            let m01 = 2.0 * (x * y - w * z);
+            let m02 = 2.0 * (x * z + w * y);
+            let m10 = 2.0 * (x * y + w * z);
+            let m20 = 2.0 * (x * z - w * y);
+            let m21 = 2.0 * (y * z + w * x);
+            let m22 = 1.0 - 2.0 * (x * x + y * y);
+
+            // Regular solution, the clamp keeps `asin` finite for rows in gimbal lock.
+            let pitch = -m20.clamp(-1.0, 1.0).asin();
+            let roll = m21.atan2(m22);
+            let yaw = m10.atan2(m00);
+            // Gimbal-lock solution, the yaw is folded into the roll.
+            let locked_down = m20 <= -1.0;
+            let locked_roll = if locked_down {
+                m01.atan2(m02)
+            } else {
+                -(m01.atan2(-m02))
+            };
+            let locked_pitch = if locked_down { FRAC_PI_2 } else { -FRAC_PI_2 };
+
+            let regular = m20.abs() < 1.0;
+            out[0] = if regular { roll } else { locked_roll };
+            out[1] = if regular { pitch } else { locked_pitch };
+            out[2] = if regular { yaw } else { 0.0 };
+        }
+        rpy
+    }
+}
+
+multiversion! {
+    /// Composes a rotation with a batch of quaternions.
+    ///
+    /// Each row `q` is replaced by the Hamilton product `rotation * q`, i.e. `q` is applied first.
+    ///
+    /// # Arguments
+    /// - `rotation`: The rotation to compose with.
+    /// - `quaternions`: The quaternions as row-major buffer of `[x, y, z, w]` rows.
+    ///
+    /// # Returns
+    /// The composed quaternions in the same layout.
+    ///
+    /// # Panics
+    /// Panics if the length of `quaternions` is not a multiple of four.
+    #[must_use]
+    pub fn compose_quaternions(rotation: &UnitQuaternion<f64>, quaternions: &[f64]) -> Vec<f64> {
+        assert_eq!(
+            quaternions.len() % 4,
+            0,
+            "quaternions must consist of [x, y, z, w] rows"
+        );
+        if is_identity(rotation) {
+            return quaternions.to_vec();
+        }
+        let lhs = [rotation.i, rotation.j, rotation.k, rotation.w];
+        let mut composed = vec![0.0; quaternions.len()];
+
+        for (rhs, out) in quaternions
+            .chunks_exact(4)
+            .zip(composed.chunks_exact_mut(4))
+        {
+            hamilton_product(&lhs, rhs, out);
+        }
+        composed
+    }
+}
+
+multiversion! {
+    /// Multiplies two batches of quaternions pairwise.
+    ///
+    /// # Arguments
+    /// - `lhs`: The left factors as row-major buffer of `[x, y, z, w]` rows.
+    /// - `rhs`: The right factors in the same layout.
+    ///
+    /// # Returns
+    /// The Hamilton products `lhs[i] * rhs[i]` in the same layout.
+    ///
+    /// # Panics
+    /// Panics if the buffers differ in length or their length is not a multiple of four.
+    #[must_use]
+    pub fn multiply_quaternions(lhs: &[f64], rhs: &[f64]) -> Vec<f64> {
+        assert_eq!(
+            lhs.len() % 4,
+            0,
+            "quaternions must consist of [x, y, z, w] rows"
+        );
+        assert_eq!(lhs.len(), rhs.len(), "batches must have the same length");
+        let mut products = vec![0.0; lhs.len()];
+
+        for ((p, q), out) in lhs
+            .chunks_exact(4)
+            .zip(rhs.chunks_exact(4))
+            .zip(products.chunks_exact_mut(4))
+        {
+            hamilton_product(p, q, out);
+        }
+        products
+    }
+}
+
+/// Returns whether the quaternion is exactly the identity, e.g. a frame without rotation.
+///
+/// Such rotations are common enough in practice that the kernels skip the arithmetic for them.
+#[allow(clippy::float_cmp)]
+fn is_identity(rotation: &UnitQuaternion<f64>) -> bool {
+    rotation.w == 1.0 && rotation.i == 0.0 && rotation.j == 0.0 && rotation.k == 0.0
+}
+
+/// Writes the Hamilton product `p * q` of two `[x, y, z, w]` quaternions to `out`.
+///
+/// Always inlined, so that the AVX2/FMA kernel variants keep the components in registers.
+#[allow(clippy::inline_always)]
+#[inline(always)]
+fn hamilton_product(p: &[f64], q: &[f64], out: &mut [f64]) {
+    let (px, py, pz, pw) = (p[0], p[1], p[2], p[3]);
+    let (qx, qy, qz, qw) = (q[0], q[1], q[2], q[3]);
+    out[0] = pw * qx + px * qw + py * qz - pz * qy;
+    out[1] = pw * qy - px * qz + py * qw + pz * qx;
+    out[2] = pw * qz + px * qy - py * qx + pz * qw;
+    out[3] = pw * qw - px * qx - py * qy - pz * qz;
+}
+
+multiversion! {
+    /// Transforms a batch of points by an isometry.
+    ///
+    /// The rotation matrix is built once and each point costs 9 multiplications and 9 additions.
+    ///
+    /// # Arguments
+    /// - `isometry`: The isometry to apply.
+    /// - `points`: The points as row-major buffer of `[x, y, z]` rows.
+    ///
+    /// # Returns
+    /// The transformed points in the same layout.
+    ///
+    /// # Panics
+    /// Panics if the length of `points` is not a multiple of three.
+    #[must_use]
+    pub fn transform_points(isometry: &Isometry3<f64>, points: &[f64]) -> Vec<f64> {
+        assert_eq!(points.len() % 3, 0, "points must consist of [x, y, z] rows");
+        let t = isometry.translation.vector;
+        if is_identity(&isometry.rotation) {
+            let mut translated = points.to_vec();
+            for out in translated.chunks_exact_mut(3) {
+                out[0] += t.x;
+                out[1] += t.y;
+                out[2] += t.z;
+            }
+            return translated;
+        }
+        let m = quaternion_to_matrix(&isometry.rotation);
+        let mut transformed = vec![0.0; points.len()];
+
+        for (point, out) in points.chunks_exact(3).zip(transformed.chunks_exact_mut(3)) {
+            let (px, py, pz) = (point[0], point[1], point[2]);
+            out[0] = m[(0, 0)] * px + m[(0, 1)] * py + m[(0, 2)] * pz + t.x;
+            out[1] = m[(1, 0)] * px + m[(1, 1)] * py + m[(1, 2)] * pz + t.y;
+            out[2] = m[(2, 0)] * px + m[(2, 1)] * py + m[(2, 2)] * pz + t.z;
+        }
+        transformed
+    }
+}
+
+/// Converts a unit quaternion to a rotation matrix.
+///
+/// # Arguments
+/// - `rotation`: The rotation to convert.
+///
+/// # Returns
+/// The rotation matrix.
+#[must_use]
+pub fn quaternion_to_matrix(rotation: &UnitQuaternion<f64>) -> Matrix3<f64> {
+    Matrix3::from_row_slice(&matrix_entries(&[
+        rotation.i, rotation.j, rotation.k, rotation.w,
+    ]))
+}
+
+multiversion! {
+    /// Converts a batch of unit quaternions to rotation matrices.
+    ///
+    /// # Arguments
+    /// - `quaternions`: The unit quaternions as row-major buffer of `[x, y, z, w]` rows.
+    ///
+    /// # Returns
+    /// The rotation matrices as row-major buffer of nine entries `[m00, m01, ..., m22]` per row.
+    ///
+    /// # Panics
+    /// Panics if the length of `quaternions` is not a multiple of four.
+    #[must_use]
+    pub fn quaternions_to_matrices(quaternions: &[f64]) -> Vec<f64> {
+        assert_eq!(
+            quaternions.len() % 4,
+            0,
+            "quaternions must consist of [x, y, z, w] rows"
+        );
+        let mut matrices = vec![0.0; quaternions.len() / 4 * 9];
+
+        for (quat, out) in quaternions
+            .chunks_exact(4)
+            .zip(matrices.chunks_exact_mut(9))
+        {
+            out.copy_from_slice(&matrix_entries(quat));
+        }
+        matrices
+    }
+}
+
+/// Returns the row-major rotation matrix entries of an `[x, y, z, w]` unit quaternion.
+///
+/// The nine pairwise products are computed once and shared between the entries. Always inlined,
+/// like [`hamilton_product`].
+#[allow(clippy::inline_always)]
+#[inline(always)]
+fn matrix_entries(quat: &[f64]) -> [f64; 9] {
+    let (x, y, z, w) = (quat[0], quat[1], quat[2], quat[3]);
+    let (xx, yy, zz) = (x * x, y * y, z * z);
+    let (xy, xz, yz) = (x * y, x * z, y * z);
+    let (wx, wy, wz) = (w * x, w * y, w * z);
+    [
+        1.0 - 2.0 * (yy + zz),
+        2.0 * (xy - wz),
+        2.0 * (xz + wy),
+        2.0 * (xy + wz),
+        1.0 - 2.0 * (xx + zz),
+        2.0 * (yz - wx),
+        2.0 * (xz - wy),
+        2.0 * (yz + wx),
+        1.0 - 2.0 * (xx + yy),
+    ]
+}
+
+multiversion! {
+    /// Converts a batch of roll-pitch-yaw angles to quaternions.
+    ///
+    /// Uses the same convention as [`UnitQuaternion::from_euler_angles`].
+    ///
+    /// # Arguments
+    /// - `rpy`: The angles in radians as row-major buffer of `[roll, pitch, yaw]` rows.
+    ///
+    /// # Returns
+    /// The quaternions as row-major buffer of `[x, y, z, w]` rows.
+    ///
+    /// # Panics
+    /// Panics if the length of `rpy` is not a multiple of three.
+    #[must_use]
+    pub fn rpy_to_quaternions(rpy: &[f64]) -> Vec<f64> {
+        assert_eq!(
+            rpy.len() % 3,
+            0,
+            "angles must consist of [roll, pitch, yaw] rows"
+        );
+        let mut quaternions = vec![0.0; rpy.len() / 3 * 4];
+
+        for (angles, out) in rpy.chunks_exact(3).zip(quaternions.chunks_exact_mut(4)) {
+            let (sr, cr) = (angles[0] * 0.5).sin_cos();
+            let (sp, cp) = (angles[1] * 0.5).sin_cos();
+            let (sy, cy) = (angles[2] * 0.5).sin_cos();
+            out[0] = sr * cp * cy - cr * sp * sy;
+            out[1] = cr * sp * cy + sr * cp * sy;
+            out[2] = cr * cp * sy - sr * sp * cy;
+            out[3] = cr * cp * cy + sr * sp * sy;
+        }
+        quaternions
+    }
+}
+
+multiversion! {
+    /// Normalizes a batch of quaternions.
+    ///
+    /// Rows with zero length yield `NaN`, like [`UnitQuaternion::new_normalize`].
+    ///
+    /// # Arguments
+    /// - `quaternions`: The quaternions as row-major buffer of `[x, y, z, w]` rows.
+    ///
+    /// # Returns
+    /// The normalized quaternions in the same layout.
+    ///
+    /// # Panics
+    /// Panics if the length of `quaternions` is not a multiple of four.
+    #[must_use]
+    pub fn normalize_quaternions(quaternions: &[f64]) -> Vec<f64> {
+        assert_eq!(
+            quaternions.len() % 4,
+            0,
+            "quaternions must consist of [x, y, z, w] rows"
+        );
+        let mut normalized = vec![0.0; quaternions.len()];
+
+        for (quat, out) in quaternions
+            .chunks_exact(4)
+            .zip(normalized.chunks_exact_mut(4))
+        {
+            let norm_squared =
+                quat[0] * quat[0] + quat[1] * quat[1] + quat[2] * quat[2] + quat[3] * quat[3];
+            let inv_norm = norm_squared.sqrt().recip();
+            out[0] = quat[0] * inv_norm;
+            out[1] = quat[1] * inv_norm;
+            out[2] = quat[2] * inv_norm;
+            out[3] = quat[3] * inv_norm;
+        }
+        normalized
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use approx::assert_relative_eq;
+    use nalgebra::Vector3;
+
+    #[test]
+    fn rotate_points_matches_nalgebra() {
+        let rotation = UnitQuaternion::from_euler_angles(0.1, 0.2, 0.3);
+        let points = [1.0, 2.0, 3.0, -4.0, 5.0, -6.0, 0.0, 0.0, 0.0];
+
+        let rotated = rotate_points(&rotation, &points);
+
+        assert_eq!(rotated.len(), points.len());
+        for (point, result) in points.chunks_exact(3).zip(rotated.chunks_exact(3)) {
+            let expected = rotation * Vector3::from_column_slice(point);
+            assert_relative_eq!(
+                Vector3::from_column_slice(result),
+                expected,
+                epsilon = 1e-12
+            );
+        }
+    }
+
+    #[test]
+    fn rotate_points_matrix_matches_quaternion_formula() {
+        let rotation = UnitQuaternion::from_euler_angles(0.1, 0.2, 0.3);
+        let points = [1.0, 2.0, 3.0, -4.0, 5.0, -6.0, 0.0, 0.0, 0.0];
+
+        let rotated = rotate_points_matrix(&rotation.to_rotation_matrix().into_inner(), &points);
+
+        for (expected, result) in rotate_points(&rotation, &points).iter().zip(&rotated) {
+            assert_relative_eq!(*result, *expected, epsilon = 1e-12);
+        }
+    }
+
+    #[test]
+    fn quaternions_to_matrices_matches_nalgebra() {
+        let rotations = [
+            UnitQuaternion::from_euler_angles(0.1, 0.2, 0.3),
+            UnitQuaternion::from_euler_angles(-1.0, 0.5, 2.5),
+        ];
+        let quaternions: Vec<f64> = rotations
+            .iter()
+            .flat_map(|q| q.coords.iter().copied())
+            .collect();
+
+        let matrices = quaternions_to_matrices(&quaternions);
+
+        for (rotation, result) in rotations.iter().zip(matrices.chunks_exact(9)) {
+            let expected = rotation.to_rotation_matrix().into_inner();
+            assert_relative_eq!(Matrix3::from_row_slice(result), expected, epsilon = 1e-12);
+            assert_relative_eq!(quaternion_to_matrix(rotation), expected, epsilon = 1e-12);
+        }
+    }
+
+    #[test]
+    fn rpy_to_quaternions_matches_nalgebra() {
+        let rpy = [0.1, 0.2, 0.3, -1.0, 0.5, 2.5, 0.0, FRAC_PI_2, 0.0];
+
+        let quaternions = rpy_to_quaternions(&rpy);
+
+        assert_eq!(quaternions.len(), 12);
+        for (angles, result) in rpy.chunks_exact(3).zip(quaternions.chunks_exact(4)) {
+            let expected = UnitQuaternion::from_euler_angles(angles[0], angles[1], angles[2]);
+            assert_relative_eq!(result[0], expected.i, epsilon = 1e-12);
+            assert_relative_eq!(result[1], expected.j, epsilon = 1e-12);
+            assert_relative_eq!(result[2], expected.k, epsilon = 1e-12);
+            assert_relative_eq!(result[3], expected.w, epsilon = 1e-12);
+        }
+    }
+
+    #[test]
+    fn normalize_quaternions_matches_nalgebra() {
+        let quaternions = [
+            0.0, 0.0, 0.7071, 0.7071, 1.0, 2.0, 3.0, 4.0, 0.0, 0.0, 0.0, 2.0,
+        ];
+
+        let normalized = normalize_quaternions(&quaternions);
+
+        for (quat, result) in quaternions.chunks_exact(4).zip(normalized.chunks_exact(4)) {
+            let expected = UnitQuaternion::new_normalize(nalgebra::Quaternion::new(
+                quat[3], quat[0], quat[1], quat[2],
+            ));
+            assert_relative_eq!(result[0], expected.i, epsilon = 1e-12);
+            assert_relative_eq!(result[1], expected.j, epsilon = 1e-12);
+            assert_relative_eq!(result[2], expected.k, epsilon = 1e-12);
+            assert_relative_eq!(result[3], expected.w, epsilon = 1e-12);
+        }
+    }
+
+    #[test]
+    fn compose_quaternions_matches_nalgebra() {
+        let rotation = UnitQuaternion::from_euler_angles(0.1, 0.2, 0.3);
+        let others = [
+            UnitQuaternion::from_euler_angles(-1.0, 0.5, 2.5),
+            UnitQuaternion::identity(),
+        ];
+        let quaternions: Vec<f64> = others
+            .iter()
+            .flat_map(|q| q.coords.iter().copied())
+            .collect();
+
+        let composed = compose_quaternions(&rotation, &quaternions);
+
+        for (other, result) in others.iter().zip(composed.chunks_exact(4)) {
+            let expected = rotation * other;
+            assert_relative_eq!(result[0], expected.i, epsilon = 1e-12);
+            assert_relative_eq!(result[1], expected.j, epsilon = 1e-12);
+            assert_relative_eq!(result[2], expected.k, epsilon = 1e-12);
+            assert_relative_eq!(result[3], expected.w, epsilon = 1e-12);
+        }
+    }
+
+    #[test]
+    fn multiply_quaternions_matches_nalgebra() {
+        let lhs = [
+            UnitQuaternion::from_euler_angles(0.1, 0.2, 0.3),
+            UnitQuaternion::from_euler_angles(0.0, 0.0, FRAC_PI_2),
+        ];
+        let rhs = [
+            UnitQuaternion::from_euler_angles(-1.0, 0.5, 2.5),
+            UnitQuaternion::from_euler_angles(FRAC_PI_2, 0.0, 0.0),
+        ];
+        let flatten = |quats: &[UnitQuaternion<f64>]| -> Vec<f64> {
+            quats
+                .iter()
+                .flat_map(|q| q.coords.iter().copied())
+                .collect()
+        };
+
+        let products = multiply_quaternions(&flatten(&lhs), &flatten(&rhs));
+
+        for ((p, q), result) in lhs.iter().zip(&rhs).zip(products.chunks_exact(4)) {
+            let expected = p * q;
+            assert_relative_eq!(result[0], expected.i, epsilon = 1e-12);
+            assert_relative_eq!(result[1], expected.j, epsilon = 1e-12);
+            assert_relative_eq!(result[2], expected.k, epsilon = 1e-12);
+            assert_relative_eq!(result[3], expected.w, epsilon = 1e-12);
+        }
+    }
+
+    #[test]
+    fn quaternions_to_rpy_matches_nalgebra() {
+        let rotations = [
+            UnitQuaternion::from_euler_angles(0.1, 0.2, 0.3),
+            UnitQuaternion::from_euler_angles(-1.0, 0.5, 2.5),
+            UnitQuaternion::from_euler_angles(0.3, FRAC_PI_2, 0.0),
+            UnitQuaternion::from_euler_angles(0.3, -FRAC_PI_2, 0.0),
+            // Rows that end up exactly in gimbal lock.
+            UnitQuaternion::from_euler_angles(-1.2, FRAC_PI_2, 0.0),
+            UnitQuaternion::from_euler_angles(-1.2, -FRAC_PI_2, 0.0),
+        ];
+        let quaternions: Vec<f64> = rotations
+            .iter()
+            .flat_map(|q| q.coords.iter().copied())
+            .collect();
+
+        let rpy = quaternions_to_rpy(&quaternions);
+
+        for (rotation, result) in rotations.iter().zip(rpy.chunks_exact(3)) {
+            let (roll, pitch, yaw) = rotation.euler_angles();
+            assert_relative_eq!(result[1], pitch, epsilon = 1e-9);
+            let actual = UnitQuaternion::from_euler_angles(result[0], result[1], result[2]);
+            assert_relative_eq!(actual.angle_to(rotation), 0.0, epsilon = 1e-6);
+            if pitch.abs() < 1.0 {
+                assert_relative_eq!(result[0], roll, epsilon = 1e-12);
+                assert_relative_eq!(result[2], yaw, epsilon = 1e-12);
+            }
+            assert!(result.iter().all(|angle| angle.is_finite()));
+        }
+    }
+
+    #[test]
+    fn transform_points_matches_nalgebra() {
+        let isometry = Isometry3::new(Vector3::new(1.0, -2.0, 3.0), Vector3::new(0.1, 0.2, 0.3));
+        let points = [1.0, 2.0, 3.0, -4.0, 5.0, -6.0, 0.0, 0.0, 0.0];
+
+        let transformed = transform_points(&isometry, &points);
+
+        for (point, result) in points.chunks_exact(3).zip(transformed.chunks_exact(3)) {
+            let expected = isometry * nalgebra::Point3::new(point[0], point[1], point[2]);
+            assert_relative_eq!(
+                Vector3::from_column_slice(result),
+                expected.coords,
+                epsilon = 1e-12
+            );
+        }
+    }
+
+    #[test]
+    fn kernels_skip_identity_rotation() {
+        let points = [1.0, 2.0, 3.0, -4.0, 5.0, -6.0];
+        let identity = UnitQuaternion::identity();
+
+        assert_eq!(rotate_points(&identity, &points), points);
+        assert_eq!(rotate_points_matrix(&Matrix3::identity(), &points), points);
+        assert_eq!(
+            compose_quaternions(&identity, &[0.0, 0.0, 1.0, 0.0]),
+            [0.0, 0.0, 1.0, 0.0]
+        );
+        let translation = Isometry3::translation(1.0, 1.0, 1.0);
+        assert_eq!(
+            transform_points(&translation, &points),
+            [2.0, 3.0, 4.0, -3.0, 6.0, -5.0]
+        );
+    }
+
+    #[test]
+    fn rotate_points_handles_empty_batch() {
+        assert!(rotate_points(&UnitQuaternion::identity(), &[]).is_empty());
+    }
+}
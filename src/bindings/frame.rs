@@ -1,12 +1,17 @@
+use nalgebra::Vector3;
+use numpy::{PyArray2, PyReadonlyArray1, PyReadonlyArray2};
+use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
+use pyo3::types::PyBytes;
 
 use crate::{
-    Frame as RustFrame,
+    Frame as RustFrame, batch,
     bindings::{
         PyPose,
         lazy_access::{PyLazyRotation, PyLazyTranslation},
-        utils::{PyIsometry, PyRotation, PyVector3},
+        utils::{PyIsometry, PyRotation, PyVector3, rows, to_array2},
     },
+    rotation::Rotation,
     tree::{HasChildren, HasParent, Walking},
 };
 
@@ -35,8 +40,8 @@ impl PyFrame {
     fn add_child(
         &self,
         name: String,
-        position: PyVector3,
-        orientation: PyRotation,
+        position: &PyVector3,
+        orientation: &PyRotation,
     ) -> PyResult<Self> {
         let child_frame =
             self.rust_frame
@@ -46,12 +51,48 @@ impl PyFrame {
         })
     }
 
+    #[pyo3(signature = (name, position, quaternion))]
+    fn add_child_quat(
+        &self,
+        name: String,
+        position: (f64, f64, f64),
+        quaternion: (f64, f64, f64, f64),
+    ) -> PyResult<Self> {
+        let (x, y, z, w) = quaternion;
+        let child_frame = self.rust_frame.add_child(
+            name,
+            Vector3::new(position.0, position.1, position.2),
+            Rotation::from_quaternion(x, y, z, w),
+        )?;
+        Ok(Self {
+            rust_frame: child_frame,
+        })
+    }
+
+    #[pyo3(signature = (name, position, rpy))]
+    fn add_child_rpy(
+        &self,
+        name: String,
+        position: (f64, f64, f64),
+        rpy: (f64, f64, f64),
+    ) -> PyResult<Self> {
+        let (roll, pitch, yaw) = rpy;
+        let child_frame = self.rust_frame.add_child(
+            name,
+            Vector3::new(position.0, position.1, position.2),
+            Rotation::from_rpy(roll, pitch, yaw),
+        )?;
+        Ok(Self {
+            rust_frame: child_frame,
+        })
+    }
+
     #[pyo3(signature = (name, desired_position, desired_orientation, reference_pose))]
     fn calibrate_child(
         &self,
         name: String,
-        desired_position: PyVector3,
-        desired_orientation: PyRotation,
+        desired_position: &PyVector3,
+        desired_orientation: &PyRotation,
         reference_pose: &PyPose,
     ) -> PyResult<Self> {
         let new_rust_frame = self.rust_frame.calibrate_child(
@@ -66,7 +107,7 @@ impl PyFrame {
     }
 
     #[pyo3(signature = (position, orientation))]
-    fn add_pose(&self, position: PyVector3, orientation: PyRotation) -> PyPose {
+    fn add_pose(&self, position: &PyVector3, orientation: &PyRotation) -> PyPose {
         let rust_pose = self
             .rust_frame
             .add_pose(position.inner, orientation.rust_rotation);
@@ -100,24 +141,37 @@ impl PyFrame {
     }
 
     #[pyo3(signature = (position, orientation))]
-    fn set(&self, position: PyVector3, orientation: PyRotation) -> PyResult<()> {
+    fn set(&self, position: &PyVector3, orientation: &PyRotation) -> PyResult<()> {
         self.rust_frame
             .set(position.inner, orientation.rust_rotation)?;
         Ok(())
     }
 
     #[pyo3(signature = (isometry))]
-    fn apply_in_parent_frame(&self, isometry: PyIsometry) -> PyResult<()> {
+    fn apply_in_parent_frame(&self, isometry: &PyIsometry) -> PyResult<()> {
         self.rust_frame.apply_in_parent_frame(&isometry.inner)?;
         Ok(())
     }
 
     #[pyo3(signature = (isometry))]
-    fn apply_in_local_frame(&self, isometry: PyIsometry) -> PyResult<()> {
+    fn apply_in_local_frame(&self, isometry: &PyIsometry) -> PyResult<()> {
         self.rust_frame.apply_in_local_frame(&isometry.inner)?;
         Ok(())
     }
 
+    #[pyo3(signature = (points, target_frame))]
+    fn transform_points<'py>(
+        &self,
+        py: Python<'py>,
+        points: PyReadonlyArray2<'py, f64>,
+        target_frame: &Self,
+    ) -> PyResult<Bound<'py, PyArray2<f64>>> {
+        let isometry = self
+            .rust_frame
+            .transformation_to(&target_frame.rust_frame)?;
+        to_array2(py, batch::transform_points(&isometry, rows(&points, 3)?), 3)
+    }
+
     fn to_json(&self) -> PyResult<String> {
         Ok(self.rust_frame.to_json()?)
     }
@@ -128,6 +182,36 @@ impl PyFrame {
         Ok(())
     }
 
+    fn to_bytes<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        Ok(PyBytes::new(py, &self.rust_frame.to_bytes()?))
+    }
+
+    #[pyo3(signature = (data))]
+    fn apply_config_bytes(&self, data: &[u8]) -> PyResult<()> {
+        self.rust_frame.apply_config_bytes(data)?;
+        Ok(())
+    }
+
+    #[pyo3(signature = (names, parent_ids, positions, quaternions))]
+    fn apply_config_arrays(
+        &self,
+        names: Vec<String>,
+        parent_ids: PyReadonlyArray1<'_, i32>,
+        positions: PyReadonlyArray2<'_, f64>,
+        quaternions: PyReadonlyArray2<'_, f64>,
+    ) -> PyResult<()> {
+        let parent_ids = parent_ids
+            .as_slice()
+            .map_err(|err| PyValueError::new_err(err.to_string()))?;
+        self.rust_frame.apply_config_arrays(
+            &names,
+            parent_ids,
+            rows(&positions, 3)?,
+            rows(&quaternions, 4)?,
+        )?;
+        Ok(())
+    }
+
     #[getter]
     fn depth(&self) -> usize {
         self.rust_frame.depth()
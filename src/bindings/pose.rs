@@ -50,18 +50,18 @@ impl PyPose {
     }
 
     #[pyo3(signature = (position, orientation))]
-    fn set(&mut self, position: PyVector3, orientation: PyRotation) {
+    fn set(&mut self, position: &PyVector3, orientation: &PyRotation) {
         self.rust_pose
             .set(position.inner, orientation.rust_rotation);
     }
 
     #[pyo3(signature = (isometry))]
-    fn apply_in_parent_frame(&mut self, isometry: PyIsometry) {
+    fn apply_in_parent_frame(&mut self, isometry: &PyIsometry) {
         self.rust_pose.apply_in_parent_frame(&isometry.inner);
     }
 
     #[pyo3(signature = (isometry))]
-    fn apply_in_local_frame(&mut self, isometry: PyIsometry) {
+    fn apply_in_local_frame(&mut self, isometry: &PyIsometry) {
         self.rust_pose.apply_in_local_frame(&isometry.inner);
     }
 
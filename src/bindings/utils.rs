@@ -1,16 +1,44 @@
 use nalgebra::{Isometry3, Translation3, UnitQuaternion, Vector3};
+use numpy::{
+    PyArray1, PyArray2, PyArray3, PyArrayMethods, PyReadonlyArray2, PyUntypedArrayMethods,
+};
+use pyo3::exceptions::{PyIndexError, PyValueError};
 use pyo3::prelude::*;
 use pyo3::types::PyType;
 
 use crate::CartesianTreeError;
+use crate::batch;
 use crate::rotation::Rotation;
 
 impl From<CartesianTreeError> for PyErr {
     fn from(err: CartesianTreeError) -> Self {
-        pyo3::exceptions::PyValueError::new_err(err.to_string())
+        PyValueError::new_err(err.to_string())
     }
 }
 
+/// Returns the row-major data of an array of shape `(N, width)`.
+pub(crate) fn rows<'a>(array: &'a PyReadonlyArray2<'_, f64>, width: usize) -> PyResult<&'a [f64]> {
+    let shape = array.shape();
+    if shape[1] != width {
+        return Err(PyValueError::new_err(format!(
+            "Expected an array of shape (N, {width}), got {shape:?}"
+        )));
+    }
+    array
+        .as_slice()
+        .map_err(|err| PyValueError::new_err(err.to_string()))
+}
+
+/// Wraps row-major data into a new array of shape `(N, width)`.
+pub(crate) fn to_array2(
+    py: Python<'_>,
+    data: Vec<f64>,
+    width: usize,
+) -> PyResult<Bound<'_, PyArray2<f64>>> {
+    let len = data.len() / width;
+    PyArray1::from_vec(py, data).reshape([len, width])
+}
+
 #[pyclass(name = "Rotation", unsendable)]
 #[derive(Clone, Copy, Debug)]
 pub struct PyRotation {
@@ -40,6 +68,78 @@ impl PyRotation {
         }
     }
 
+    #[classmethod]
+    fn quaternion_from_rpy(_cls: &Bound<'_, PyType>, roll: f64, pitch: f64, yaw: f64) -> Self {
+        Self {
+            rust_rotation: UnitQuaternion::from_euler_angles(roll, pitch, yaw).into(),
+        }
+    }
+
+    #[classmethod]
+    fn rpy_from_quaternion(_cls: &Bound<'_, PyType>, x: f64, y: f64, z: f64, w: f64) -> Self {
+        let rpy = Rotation::from_quaternion(x, y, z, w).as_rpy();
+        Self {
+            rust_rotation: Rotation::Rpy(rpy),
+        }
+    }
+
+    #[staticmethod]
+    #[pyo3(signature = (rpy))]
+    fn from_rpy_batch<'py>(
+        py: Python<'py>,
+        rpy: PyReadonlyArray2<'py, f64>,
+    ) -> PyResult<Bound<'py, PyArray2<f64>>> {
+        to_array2(py, batch::rpy_to_quaternions(rows(&rpy, 3)?), 4)
+    }
+
+    #[staticmethod]
+    #[pyo3(signature = (lhs, rhs))]
+    fn multiply_quaternion_batch<'py>(
+        py: Python<'py>,
+        lhs: PyReadonlyArray2<'py, f64>,
+        rhs: PyReadonlyArray2<'py, f64>,
+    ) -> PyResult<Bound<'py, PyArray2<f64>>> {
+        let (lhs, rhs) = (rows(&lhs, 4)?, rows(&rhs, 4)?);
+        if lhs.len() != rhs.len() {
+            return Err(PyValueError::new_err(format!(
+                "Expected batches of the same length, got {} and {}",
+                lhs.len() / 4,
+                rhs.len() / 4
+            )));
+        }
+        let products = py.allow_threads(|| batch::multiply_quaternions(lhs, rhs));
+        to_array2(py, products, 4)
+    }
+
+    #[staticmethod]
+    #[pyo3(signature = (quaternions))]
+    fn to_matrix_batch<'py>(
+        py: Python<'py>,
+        quaternions: PyReadonlyArray2<'py, f64>,
+    ) -> PyResult<Bound<'py, PyArray3<f64>>> {
+        let matrices = batch::quaternions_to_matrices(rows(&quaternions, 4)?);
+        let len = matrices.len() / 9;
+        PyArray1::from_vec(py, matrices).reshape([len, 3, 3])
+    }
+
+    #[staticmethod]
+    #[pyo3(signature = (quaternions))]
+    fn to_rpy_batch<'py>(
+        py: Python<'py>,
+        quaternions: PyReadonlyArray2<'py, f64>,
+    ) -> PyResult<Bound<'py, PyArray2<f64>>> {
+        to_array2(py, batch::quaternions_to_rpy(rows(&quaternions, 4)?), 3)
+    }
+
+    #[staticmethod]
+    #[pyo3(signature = (quaternions))]
+    fn normalize_quaternion_batch<'py>(
+        py: Python<'py>,
+        quaternions: PyReadonlyArray2<'py, f64>,
+    ) -> PyResult<Bound<'py, PyArray2<f64>>> {
+        to_array2(py, batch::normalize_quaternions(rows(&quaternions, 4)?), 4)
+    }
+
     #[allow(clippy::wrong_self_convention)]
     fn as_quaternion(&self) -> (f64, f64, f64, f64) {
         let quat = self.rust_rotation.as_quaternion();
@@ -52,6 +152,44 @@ impl PyRotation {
         (rpy.x, rpy.y, rpy.z)
     }
 
+    #[pyo3(signature = (points))]
+    fn apply_batch<'py>(
+        &self,
+        py: Python<'py>,
+        points: PyReadonlyArray2<'py, f64>,
+    ) -> PyResult<Bound<'py, PyArray2<f64>>> {
+        let rotated = batch::rotate_points(&self.rust_rotation.as_quaternion(), rows(&points, 3)?);
+        to_array2(py, rotated, 3)
+    }
+
+    #[pyo3(signature = (points))]
+    fn apply_matrix_batch<'py>(
+        &self,
+        py: Python<'py>,
+        points: PyReadonlyArray2<'py, f64>,
+    ) -> PyResult<Bound<'py, PyArray2<f64>>> {
+        let matrix = batch::quaternion_to_matrix(&self.rust_rotation.as_quaternion());
+        let rotated = batch::rotate_points_matrix(&matrix, rows(&points, 3)?);
+        to_array2(py, rotated, 3)
+    }
+
+    #[pyo3(signature = (quaternions))]
+    fn compose_batch<'py>(
+        &self,
+        py: Python<'py>,
+        quaternions: PyReadonlyArray2<'py, f64>,
+    ) -> PyResult<Bound<'py, PyArray2<f64>>> {
+        let composed =
+            batch::compose_quaternions(&self.rust_rotation.as_quaternion(), rows(&quaternions, 4)?);
+        to_array2(py, composed, 4)
+    }
+
+    #[allow(clippy::wrong_self_convention)]
+    fn to_matrix<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyArray2<f64>>> {
+        let q = self.rust_rotation.as_quaternion();
+        to_array2(py, batch::quaternions_to_matrices(&[q.i, q.j, q.k, q.w]), 3)
+    }
+
     fn __str__(&self) -> String {
         match &self.rust_rotation {
             Rotation::Quaternion(q) => {
@@ -104,6 +242,21 @@ impl PyVector3 {
         (self.inner.x, self.inner.y, self.inner.z)
     }
 
+    fn normalize(&self) -> PyResult<Self> {
+        self.inner
+            .try_normalize(0.0)
+            .filter(|inner| inner.iter().all(|value| value.is_finite()))
+            .map(|inner| Self { inner })
+            .ok_or_else(|| {
+                PyValueError::new_err("Cannot normalize a vector of zero or non-finite length")
+            })
+    }
+
+    #[allow(clippy::wrong_self_convention)]
+    fn as_array<'py>(&self, py: Python<'py>) -> Bound<'py, PyArray1<f64>> {
+        PyArray1::from_slice(py, self.inner.as_slice())
+    }
+
     fn __str__(&self) -> String {
         format!("({:.4}, {:.4}, {:.4})", self.x(), self.y(), self.z())
     }
@@ -113,6 +266,63 @@ impl PyVector3 {
     }
 }
 
+#[pyclass(name = "Vector3Array", unsendable)]
+#[derive(Clone, Debug)]
+pub struct PyVector3Array {
+    /// Row-major `[x, y, z]` rows.
+    pub data: Vec<f64>,
+}
+
+#[pymethods]
+impl PyVector3Array {
+    #[new]
+    #[pyo3(signature = (vectors))]
+    fn new(vectors: PyReadonlyArray2<'_, f64>) -> PyResult<Self> {
+        Ok(Self {
+            data: rows(&vectors, 3)?.to_vec(),
+        })
+    }
+
+    #[pyo3(signature = (rotation))]
+    fn rotate(&self, rotation: &PyRotation) -> Self {
+        Self {
+            data: batch::rotate_points(&rotation.rust_rotation.as_quaternion(), &self.data),
+        }
+    }
+
+    #[allow(clippy::wrong_self_convention)]
+    fn as_array<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyArray2<f64>>> {
+        to_array2(py, self.data.clone(), 3)
+    }
+
+    fn __len__(&self) -> usize {
+        self.data.len() / 3
+    }
+
+    fn __getitem__(&self, index: isize) -> PyResult<PyVector3> {
+        let len = self.__len__();
+        let position = if index < 0 {
+            len.checked_sub(index.unsigned_abs())
+        } else {
+            Some(index.unsigned_abs())
+        };
+        match position {
+            Some(i) if i < len => Ok(PyVector3 {
+                inner: Vector3::from_column_slice(&self.data[3 * i..3 * i + 3]),
+            }),
+            _ => Err(PyIndexError::new_err("Vector3Array index out of range")),
+        }
+    }
+
+    fn __str__(&self) -> String {
+        format!("Vector3Array(len: {})", self.__len__())
+    }
+
+    fn __repr__(&self) -> String {
+        self.__str__()
+    }
+}
+
 #[pyclass(name = "Isometry", unsendable)]
 #[derive(Clone, Copy, Debug)]
 pub struct PyIsometry {
@@ -129,7 +339,7 @@ impl PyIsometry {
     }
 
     #[classmethod]
-    fn from_translation(_cls: &Bound<'_, PyType>, translation: PyVector3) -> Self {
+    fn from_translation(_cls: &Bound<'_, PyType>, translation: &PyVector3) -> Self {
         Self {
             inner: Isometry3::from_parts(
                 Translation3::from(translation.inner),
@@ -139,7 +349,7 @@ impl PyIsometry {
     }
 
     #[classmethod]
-    fn from_rotation(_cls: &Bound<'_, PyType>, rotation: PyRotation) -> Self {
+    fn from_rotation(_cls: &Bound<'_, PyType>, rotation: &PyRotation) -> Self {
         Self {
             inner: Isometry3::from_parts(
                 Translation3::new(0.0, 0.0, 0.0),
@@ -149,7 +359,11 @@ impl PyIsometry {
     }
 
     #[classmethod]
-    fn from_parts(_cls: &Bound<'_, PyType>, translation: PyVector3, rotation: PyRotation) -> Self {
+    fn from_parts(
+        _cls: &Bound<'_, PyType>,
+        translation: &PyVector3,
+        rotation: &PyRotation,
+    ) -> Self {
         Self {
             inner: Isometry3::from_parts(
                 Translation3::from(translation.inner),
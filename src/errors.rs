@@ -18,4 +18,6 @@ pub enum CartesianTreeError {
     SerdeError(#[from] serde_json::Error),
     #[error("Tree structure mismatch during config apply: {0}")]
     Mismatch(String),
+    #[error("Invalid binary config: {0}")]
+    InvalidBinary(String),
 }
@@ -1,5 +1,6 @@
 use crate::CartesianTreeError;
 use crate::Pose;
+use crate::batch;
 use crate::lazy_access::LazyRotation;
 use crate::lazy_access::LazyTranslation;
 use crate::rotation::Rotation;
@@ -7,8 +8,8 @@ use crate::tree::Walking;
 use crate::tree::{HasChildren, HasParent, NodeEquality};
 
 use nalgebra::UnitQuaternion;
-use nalgebra::{Isometry3, Translation3, Vector3};
-use std::cell::RefCell;
+use nalgebra::{Isometry3, Quaternion, Translation3, Vector3};
+use std::cell::{Cell, RefCell};
 use std::ops::Add;
 use std::ops::Mul;
 use std::ops::Sub;
@@ -39,6 +40,16 @@ pub(crate) struct FrameData {
     transform_to_parent: Isometry3<f64>,
     /// Child frames directly connected to this frame.
     children: Vec<Frame>,
+    /// Number of ancestors, fixed when the frame is inserted.
+    depth: usize,
+    /// Reference to the root frame, `None` for the root itself.
+    ///
+    /// Parents own their children, so the stored depth is accurate as long as the root is alive.
+    root: Option<Weak<RefCell<FrameData>>>,
+    /// Revision counter shared by the whole tree, bumped whenever a transformation changes.
+    revision: Rc<Cell<u64>>,
+    /// Transformation from this frame to the root, tagged with the revision it was computed at.
+    root_cache: Cell<Option<(u64, Isometry3<f64>)>>,
 }
 
 #[derive(Serialize, Deserialize, Debug, Clone)]
@@ -69,6 +80,10 @@ impl Frame {
                 parent: None,
                 children: Vec::new(),
                 transform_to_parent: Isometry3::identity(),
+                depth: 0,
+                root: None,
+                revision: Rc::new(Cell::new(0)),
+                root_cache: Cell::new(None),
             })),
         }
     }
@@ -85,33 +100,40 @@ impl Frame {
         Rc::downgrade(&self.data)
     }
 
-    pub(crate) fn walk_up_and_transform(
-        &self,
-        target: &Self,
-    ) -> Result<Isometry3<f64>, CartesianTreeError> {
-        let mut transform = Isometry3::identity();
-        let mut current = self.clone();
-
-        while !current.is_same(target) {
-            let transform_to_its_parent = {
-                // Scope borrow
-                let current_data = current.borrow();
-
-                // If current frame is root and not target, then target is not an ancestor.
-                if current_data.parent.is_none() {
-                    return Err(CartesianTreeError::IsNoAncestor(target.name(), self.name()));
-                }
-                current_data.transform_to_parent
-            };
+    /// Marks every cached root transformation of the tree as stale.
+    fn invalidate_transformations(&self) {
+        let data = self.borrow();
+        data.revision.set(data.revision.get() + 1);
+    }
 
-            transform = transform_to_its_parent * transform;
+    /// Returns the transformation from this frame to the root of its tree.
+    ///
+    /// The result is cached per frame and reused until any transformation of the tree changes, so
+    /// only the frames above the closest valid cache entry are composed.
+    fn transformation_to_root(&self) -> Isometry3<f64> {
+        let revision = self.borrow().revision.get();
+        let mut transform = Isometry3::identity();
+        let mut uncached = Vec::new();
+        let mut current = Some(self.clone());
 
-            let parent_frame_opt = current.parent();
-            current = parent_frame_opt
-                .ok_or_else(|| CartesianTreeError::IsNoAncestor(target.name(), self.name()))?;
+        while let Some(frame) = current {
+            let cached = frame.borrow().root_cache.get();
+            if let Some((_, cached)) =
+                cached.filter(|&(cached_revision, _)| cached_revision == revision)
+            {
+                transform = cached;
+                break;
+            }
+            current = frame.parent();
+            uncached.push(frame);
         }
 
-        Ok(transform)
+        for frame in uncached.iter().rev() {
+            let data = frame.borrow();
+            transform *= data.transform_to_parent;
+            data.root_cache.set(Some((revision, transform)));
+        }
+        transform
     }
 
     /// Returns the name of the frame.
@@ -135,6 +157,39 @@ impl Frame {
         Ok(self.borrow().transform_to_parent)
     }
 
+    /// Returns the transformation from this frame to another frame of the same tree.
+    ///
+    /// The isometry maps coordinates expressed in this frame to coordinates expressed in `target`.
+    ///
+    /// # Arguments
+    /// - `target`: The frame to transform into.
+    ///
+    /// # Returns
+    /// - The isometry from this frame to the target frame.
+    ///
+    /// # Errors
+    /// Returns a [`CartesianTreeError`] if:
+    /// - There is no common ancestor between `self` and `target`.
+    ///
+    /// # Example
+    /// ```
+    /// use cartesian_tree::Frame;
+    /// use nalgebra::{Vector3, UnitQuaternion};
+    ///
+    /// let root = Frame::new_origin("root");
+    /// let a = root.add_child("a", Vector3::new(1.0, 0.0, 0.0), UnitQuaternion::identity()).unwrap();
+    /// let b = root.add_child("b", Vector3::new(0.0, 1.0, 0.0), UnitQuaternion::identity()).unwrap();
+    /// let a_to_b = a.transformation_to(&b).unwrap();
+    /// ```
+    pub fn transformation_to(&self, target: &Self) -> Result<Isometry3<f64>, CartesianTreeError> {
+        self.lca_with(target)
+            .ok_or_else(|| CartesianTreeError::NoCommonAncestor(self.name(), target.name()))?;
+
+        Ok(target
+            .transformation_to_root()
+            .inv_mul(&self.transformation_to_root()))
+    }
+
     /// Returns the position of this frame relative to its parent frame.
     ///
     /// # Returns
@@ -193,6 +248,7 @@ impl Frame {
             Translation3::from(position),
             orientation.into().as_quaternion(),
         );
+        self.invalidate_transformations();
         Ok(())
     }
 
@@ -231,8 +287,11 @@ impl Frame {
         if self.parent().is_none() {
             return Err(CartesianTreeError::CannotUpdateRootTransform(self.name()));
         }
-        let mut borrow = self.borrow_mut();
-        borrow.transform_to_parent = isometry * borrow.transform_to_parent;
+        {
+            let mut borrow = self.borrow_mut();
+            borrow.transform_to_parent = isometry * borrow.transform_to_parent;
+        }
+        self.invalidate_transformations();
         Ok(())
     }
 
@@ -271,8 +330,11 @@ impl Frame {
         if self.parent().is_none() {
             return Err(CartesianTreeError::CannotUpdateRootTransform(self.name()));
         }
-        let mut borrow = self.borrow_mut();
-        borrow.transform_to_parent *= isometry;
+        {
+            let mut borrow = self.borrow_mut();
+            borrow.transform_to_parent *= isometry;
+        }
+        self.invalidate_transformations();
         Ok(())
     }
 
@@ -329,12 +391,28 @@ impl Frame {
             orientation.into().as_quaternion(),
         );
 
+        let (depth, root, revision) = {
+            let parent_data = self.borrow();
+            let root = parent_data
+                .root
+                .clone()
+                .unwrap_or_else(|| Rc::downgrade(&self.data));
+            (
+                parent_data.depth + 1,
+                root,
+                Rc::clone(&parent_data.revision),
+            )
+        };
         let child = Self {
             data: Rc::new(RefCell::new(FrameData {
                 name: child_name,
                 parent: Some(Rc::downgrade(&self.data)),
                 children: Vec::new(),
                 transform_to_parent: transform,
+                depth,
+                root: Some(root),
+                revision,
+                root_cache: Cell::new(None),
             })),
         };
 
@@ -389,20 +467,22 @@ impl Frame {
             CartesianTreeError::NoCommonAncestor(self.name(), reference_frame.name())
         })?;
 
-        let t_reference_to_ancestor = reference_frame.walk_up_and_transform(&ancestor)?;
+        let t_ancestor_to_root = ancestor.transformation_to_root();
+        let t_reference_to_ancestor =
+            t_ancestor_to_root.inv_mul(&reference_frame.transformation_to_root());
         let t_pose_to_reference = reference_pose.transformation();
         let t_pose_to_ancestor = t_reference_to_ancestor * t_pose_to_reference;
 
-        let t_parent_to_ancestor = self.walk_up_and_transform(&ancestor)?;
-        let t_ancestor_to_parent = t_parent_to_ancestor.inverse();
+        let t_parent_to_ancestor = t_ancestor_to_root.inv_mul(&self.transformation_to_root());
 
         let desired_pose = Isometry3::from_parts(
             Translation3::from(desired_position),
             desired_orientation.into().as_quaternion(),
         );
 
+        // desired^-1 * parent^-1 == (parent * desired)^-1, which needs a single inversion.
         let t_calibrated_to_parent =
-            t_pose_to_ancestor * desired_pose.inverse() * t_ancestor_to_parent;
+            t_pose_to_ancestor * (t_parent_to_ancestor * desired_pose).inverse();
 
         self.add_child(
             name,
@@ -491,32 +571,289 @@ impl Frame {
         self.apply_serial(&serial)
     }
 
-    fn apply_serial(&self, serial: &SerialFrame) -> Result<(), CartesianTreeError> {
-        if self.name() != serial.name {
+    /// Serializes the frame tree to a compact binary format.
+    ///
+    /// Holds the same information as [`Frame::to_json`], but stores the floats as raw
+    /// little-endian `f64` values, which avoids formatting and parsing them. Each frame is encoded
+    /// as its name (`u32` byte length followed by UTF-8 bytes), position (3 × `f64`), orientation
+    /// quaternion (4 × `f64`, x, y, z, w), number of children (`u32`) and then its children.
+    ///
+    /// # Returns
+    /// The serialized tree.
+    ///
+    /// # Errors
+    /// Returns a [`CartesianTreeError`] if:
+    /// - A frame name or the number of children does not fit into a `u32`.
+    pub fn to_bytes(&self) -> Result<Vec<u8>, CartesianTreeError> {
+        let mut bytes = Vec::new();
+        self.to_serial().write_bytes(&mut bytes)?;
+        Ok(bytes)
+    }
+
+    /// Applies a binary config created by [`Frame::to_bytes`] to this frame tree.
+    ///
+    /// Behaves like [`Frame::apply_config`], i.e. transforms are updated where names match.
+    ///
+    /// # Arguments
+    /// - `bytes`: The binary config to apply.
+    ///
+    /// # Returns
+    /// `Ok(())` if applied successfully (even if partial).
+    ///
+    /// # Errors
+    /// Returns a [`CartesianTreeError`] if:
+    /// - The data is not a valid binary config.
+    /// - The frame names do not match at the root.
+    pub fn apply_config_bytes(&self, bytes: &[u8]) -> Result<(), CartesianTreeError> {
+        let mut remaining = bytes;
+        let serial = SerialFrame::read_bytes(&mut remaining, 0)?;
+        if !remaining.is_empty() {
+            return Err(CartesianTreeError::InvalidBinary(format!(
+                "{} trailing bytes",
+                remaining.len()
+            )));
+        }
+        self.apply_serial(&serial)
+    }
+
+    /// Applies a config given as flat arrays to this frame tree by updating matching transforms.
+    ///
+    /// Every row describes one frame and must follow the row of its parent; the first row
+    /// describes this frame and has the parent index `-1`. Like [`Frame::apply_config`], frames
+    /// are matched by name and unmatched rows (including their descendants) are ignored. The
+    /// quaternions are normalized in a single batch before they are applied.
+    ///
+    /// # Arguments
+    /// - `names`: The frame names.
+    /// - `parent_ids`: The row index of each frame's parent, `-1` for the first row.
+    /// - `positions`: The positions as row-major buffer of `[x, y, z]` rows.
+    /// - `quaternions`: The orientations as row-major buffer of `[x, y, z, w]` rows.
+    ///
+    /// # Returns
+    /// `Ok(())` if applied successfully (even if partial).
+    ///
+    /// # Errors
+    /// Returns a [`CartesianTreeError`] if:
+    /// - The arrays are empty or do not describe the same number of frames.
+    /// - A parent index does not refer to a preceding row.
+    /// - The frame names do not match at the root.
+    ///
+    /// # Example
+    /// ```
+    /// use cartesian_tree::Frame;
+    /// use nalgebra::{Vector3, UnitQuaternion};
+    ///
+    /// let root = Frame::new_origin("root");
+    /// root.add_child("camera", Vector3::zeros(), UnitQuaternion::identity()).unwrap();
+    /// root.apply_config_arrays(
+    ///     &["root", "camera"],
+    ///     &[-1, 0],
+    ///     &[0.0, 0.0, 0.0, 1.0, 2.0, 3.0],
+    ///     &[0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0],
+    /// )
+    /// .unwrap();
+    /// ```
+    pub fn apply_config_arrays(
+        &self,
+        names: &[impl AsRef<str>],
+        parent_ids: &[i32],
+        positions: &[f64],
+        quaternions: &[f64],
+    ) -> Result<(), CartesianTreeError> {
+        let len = names.len();
+        if len == 0 {
+            return Err(CartesianTreeError::Mismatch(
+                "Config contains no frames".to_string(),
+            ));
+        }
+        if parent_ids.len() != len || positions.len() != 3 * len || quaternions.len() != 4 * len {
+            return Err(CartesianTreeError::Mismatch(format!(
+                "Expected {len} parent ids, positions and quaternions"
+            )));
+        }
+        // The first row must be the root, every other row must refer to a preceding row.
+        if let Some((index, parent_id)) =
+            parent_ids.iter().enumerate().find(|&(index, &parent_id)| {
+                usize::try_from(parent_id)
+                    .map_or(index != 0 || parent_id != -1, |parent| parent >= index)
+            })
+        {
+            return Err(CartesianTreeError::Mismatch(format!(
+                "Invalid parent index {parent_id} for frame '{}'",
+                names[index].as_ref()
+            )));
+        }
+        if self.borrow().name != names[0].as_ref() {
             return Err(CartesianTreeError::Mismatch(format!(
                 "Frame names do not match: {} vs {}",
                 self.name(),
-                serial.name
+                names[0].as_ref()
             )));
         }
-
-        // only update if frame has parent
-        if self.parent().is_some() {
-            self.set(serial.position, serial.orientation)?;
+        let quaternions = batch::normalize_quaternions(quaternions);
+
+        let mut frames: Vec<Option<Self>> = Vec::with_capacity(len);
+        for (index, (((name, &parent_id), position), q)) in names
+            .iter()
+            .zip(parent_ids)
+            .zip(positions.chunks_exact(3))
+            .zip(quaternions.chunks_exact(4))
+            .enumerate()
+        {
+            // Parent indices were validated above, so only the first row has none.
+            let frame = usize::try_from(parent_id).map_or_else(
+                |_| Some(self.clone()),
+                |parent| {
+                    frames[parent].as_ref().and_then(|parent_frame| {
+                        parent_frame
+                            .borrow()
+                            .children
+                            .iter()
+                            .find(|child| child.borrow().name == name.as_ref())
+                            .cloned()
+                    })
+                },
+            );
+
+            // only update if frame has parent
+            if let Some(frame) = frame.as_ref().filter(|f| index > 0 || f.parent().is_some()) {
+                frame.borrow_mut().transform_to_parent = Isometry3::from_parts(
+                    Translation3::new(position[0], position[1], position[2]),
+                    UnitQuaternion::new_unchecked(Quaternion::new(q[3], q[0], q[1], q[2])),
+                );
+            }
+            frames.push(frame);
         }
+        self.invalidate_transformations();
+        Ok(())
+    }
 
-        for potential_child in &serial.children {
-            if let Some(child) = self
-                .children()
-                .into_iter()
-                .find(|c| c.name() == potential_child.name)
-            {
-                child.apply_serial(potential_child)?;
-            }
+    fn apply_serial(&self, serial: &SerialFrame) -> Result<(), CartesianTreeError> {
+        let mut arrays = ConfigArrays::default();
+        serial.flatten(-1, &mut arrays)?;
+        self.apply_config_arrays(
+            &arrays.names,
+            &arrays.parent_ids,
+            &arrays.positions,
+            &arrays.quaternions,
+        )
+    }
+}
+
+/// A frame tree flattened into parent-first rows, as taken by [`Frame::apply_config_arrays`].
+#[derive(Default)]
+struct ConfigArrays {
+    names: Vec<String>,
+    parent_ids: Vec<i32>,
+    positions: Vec<f64>,
+    quaternions: Vec<f64>,
+}
+
+impl SerialFrame {
+    /// Appends the frame and its children to `arrays`, each frame after its parent.
+    fn flatten(&self, parent_id: i32, arrays: &mut ConfigArrays) -> Result<(), CartesianTreeError> {
+        let id = i32::try_from(arrays.names.len()).map_err(|_| {
+            CartesianTreeError::Mismatch("Config contains too many frames".to_string())
+        })?;
+        arrays.names.push(self.name.clone());
+        arrays.parent_ids.push(parent_id);
+        arrays.positions.extend_from_slice(self.position.as_slice());
+        arrays
+            .quaternions
+            .extend_from_slice(self.orientation.coords.as_slice());
+        for child in &self.children {
+            child.flatten(id, arrays)?;
         }
+        Ok(())
+    }
 
+    /// Appends the binary encoding of the frame and its children to `bytes`.
+    fn write_bytes(&self, bytes: &mut Vec<u8>) -> Result<(), CartesianTreeError> {
+        write_len(bytes, self.name.len())?;
+        bytes.extend_from_slice(self.name.as_bytes());
+        let q = self.orientation.coords;
+        for value in [
+            self.position.x,
+            self.position.y,
+            self.position.z,
+            q.x,
+            q.y,
+            q.z,
+            q.w,
+        ] {
+            bytes.extend_from_slice(&value.to_le_bytes());
+        }
+        write_len(bytes, self.children.len())?;
+        for child in &self.children {
+            child.write_bytes(bytes)?;
+        }
         Ok(())
     }
+
+    /// Decodes a frame and its children from the front of `bytes` and advances past them.
+    ///
+    /// `depth` is the nesting level of the frame, which is limited to keep untrusted input from
+    /// exhausting the stack.
+    fn read_bytes(bytes: &mut &[u8], depth: usize) -> Result<Self, CartesianTreeError> {
+        if depth > MAX_BINARY_DEPTH {
+            return Err(CartesianTreeError::InvalidBinary(format!(
+                "frames nested deeper than {MAX_BINARY_DEPTH} levels"
+            )));
+        }
+        let name_len = read_len(bytes)?;
+        let name = std::str::from_utf8(take_bytes(bytes, name_len)?)
+            .map_err(|err| CartesianTreeError::InvalidBinary(err.to_string()))?
+            .to_string();
+        let mut values = [0.0; 7];
+        for value in &mut values {
+            *value = f64::from_le_bytes(take_array(bytes)?);
+        }
+        let [x, y, z, qx, qy, qz, qw] = values;
+        let child_count = read_len(bytes)?;
+        // The count is untrusted, so the vector grows with the children actually read.
+        let mut children = Vec::new();
+        for _ in 0..child_count {
+            children.push(Self::read_bytes(bytes, depth + 1)?);
+        }
+        Ok(Self {
+            name,
+            position: Vector3::new(x, y, z),
+            orientation: UnitQuaternion::new_normalize(Quaternion::new(qw, qx, qy, qz)),
+            children,
+        })
+    }
+}
+
+/// Maximum nesting depth accepted by [`Frame::apply_config_bytes`], same as the JSON parser's.
+const MAX_BINARY_DEPTH: usize = 128;
+
+fn write_len(bytes: &mut Vec<u8>, len: usize) -> Result<(), CartesianTreeError> {
+    let len = u32::try_from(len)
+        .map_err(|_| CartesianTreeError::InvalidBinary(format!("length {len} exceeds u32")))?;
+    bytes.extend_from_slice(&len.to_le_bytes());
+    Ok(())
+}
+
+fn read_len(bytes: &mut &[u8]) -> Result<usize, CartesianTreeError> {
+    usize::try_from(u32::from_le_bytes(take_array(bytes)?))
+        .map_err(|err| CartesianTreeError::InvalidBinary(err.to_string()))
+}
+
+fn take_array<const N: usize>(bytes: &mut &[u8]) -> Result<[u8; N], CartesianTreeError> {
+    let mut array = [0; N];
+    array.copy_from_slice(take_bytes(bytes, N)?);
+    Ok(array)
+}
+
+fn take_bytes<'a>(bytes: &mut &'a [u8], len: usize) -> Result<&'a [u8], CartesianTreeError> {
+    if bytes.len() < len {
+        return Err(CartesianTreeError::InvalidBinary(
+            "unexpected end of data".to_string(),
+        ));
+    }
+    let (head, tail) = bytes.split_at(len);
+    *bytes = tail;
+    Ok(head)
 }
 
 impl Add<LazyTranslation> for &Frame {
@@ -573,6 +910,15 @@ impl HasParent for Frame {
             .clone()
             .and_then(|data_weak| data_weak.upgrade().map(|data_rc| Self { data: data_rc }))
     }
+
+    fn known_depth(&self) -> Option<usize> {
+        let data = self.borrow();
+        // Once the root is dropped, the parent chain is cut and has to be walked.
+        match &data.root {
+            Some(root) if root.strong_count() == 0 => None,
+            _ => Some(data.depth),
+        }
+    }
 }
 
 impl NodeEquality for Frame {
@@ -1020,6 +1366,199 @@ mod tests {
         );
     }
 
+    #[test]
+    fn test_transformation_to() {
+        let root = Frame::new_origin("root");
+        let a = root
+            .add_child(
+                "a",
+                Vector3::new(1.0, 0.0, 0.0),
+                UnitQuaternion::from_euler_angles(0.0, 0.0, std::f64::consts::FRAC_PI_2),
+            )
+            .unwrap();
+        let b = root
+            .add_child("b", Vector3::new(0.0, 2.0, 0.0), UnitQuaternion::identity())
+            .unwrap();
+
+        let a_to_b = a.transformation_to(&b).unwrap();
+
+        // The x axis of `a` points along the y axis of `root` and `b`.
+        let point = a_to_b * nalgebra::Point3::new(1.0, 0.0, 0.0);
+        assert_relative_eq!(point.coords, Vector3::new(1.0, -1.0, 0.0), epsilon = 1e-12);
+        assert_relative_eq!(
+            a.transformation_to(&a).unwrap(),
+            Isometry3::identity(),
+            epsilon = 1e-12
+        );
+        let other_root = Frame::new_origin("other");
+        assert!(matches!(
+            a.transformation_to(&other_root),
+            Err(CartesianTreeError::NoCommonAncestor(_, _))
+        ));
+    }
+
+    #[test]
+    fn test_transformation_to_follows_updates() {
+        let root = Frame::new_origin("root");
+        let a = root
+            .add_child("a", Vector3::new(1.0, 0.0, 0.0), UnitQuaternion::identity())
+            .unwrap();
+        let b = a
+            .add_child("b", Vector3::new(0.0, 1.0, 0.0), UnitQuaternion::identity())
+            .unwrap();
+
+        assert_relative_eq!(
+            b.transformation_to(&root).unwrap().translation.vector,
+            Vector3::new(1.0, 1.0, 0.0),
+            epsilon = 1e-12
+        );
+
+        // Updating an ancestor must invalidate the cached transformations of its descendants.
+        a.set(Vector3::new(2.0, 0.0, 0.0), UnitQuaternion::identity())
+            .unwrap();
+        assert_relative_eq!(
+            b.transformation_to(&root).unwrap().translation.vector,
+            Vector3::new(2.0, 1.0, 0.0),
+            epsilon = 1e-12
+        );
+
+        a.apply_in_local_frame(&Isometry3::translation(0.0, 0.0, 1.0))
+            .unwrap();
+        assert_relative_eq!(
+            root.transformation_to(&b).unwrap().translation.vector,
+            Vector3::new(-2.0, -1.0, -1.0),
+            epsilon = 1e-12
+        );
+    }
+
+    #[test]
+    fn test_to_bytes_and_apply_config_bytes() {
+        let root = Frame::new_origin("root");
+        let child = root
+            .add_child(
+                "child",
+                Vector3::new(1.0, 2.0, 3.0),
+                UnitQuaternion::from_euler_angles(0.1, 0.2, 0.3),
+            )
+            .unwrap();
+        child
+            .add_child(
+                "grandchild",
+                Vector3::new(-1.0, 0.5, 0.0),
+                UnitQuaternion::identity(),
+            )
+            .unwrap();
+
+        let bytes = root.to_bytes().unwrap();
+
+        let default_root = Frame::new_origin("root");
+        let default_child = default_root
+            .add_child("child", Vector3::zeros(), UnitQuaternion::identity())
+            .unwrap();
+        let default_grandchild = default_child
+            .add_child("grandchild", Vector3::zeros(), UnitQuaternion::identity())
+            .unwrap();
+
+        default_root.apply_config_bytes(&bytes).unwrap();
+
+        let iso = default_child.transformation().unwrap();
+        assert_eq!(iso.translation.vector, Vector3::new(1.0, 2.0, 3.0));
+        let (r, p, y) = iso.rotation.euler_angles();
+        assert!((r - 0.1).abs() < 1e-12);
+        assert!((p - 0.2).abs() < 1e-12);
+        assert!((y - 0.3).abs() < 1e-12);
+        let iso = default_grandchild.transformation().unwrap();
+        assert_eq!(iso.translation.vector, Vector3::new(-1.0, 0.5, 0.0));
+
+        // Truncated and oversized data is rejected
+        assert!(matches!(
+            default_root.apply_config_bytes(&bytes[..bytes.len() - 1]),
+            Err(CartesianTreeError::InvalidBinary(_))
+        ));
+        let mut oversized = bytes.clone();
+        oversized.push(0);
+        assert!(matches!(
+            default_root.apply_config_bytes(&oversized),
+            Err(CartesianTreeError::InvalidBinary(_))
+        ));
+
+        // Deeply nested data is rejected instead of overflowing the stack
+        let mut level = 0_u32.to_le_bytes().to_vec();
+        level.extend_from_slice(&[0; 7 * 8]);
+        level.extend_from_slice(&1_u32.to_le_bytes());
+        let nested = level.repeat(100_000);
+        assert!(matches!(
+            default_root.apply_config_bytes(&nested),
+            Err(CartesianTreeError::InvalidBinary(_))
+        ));
+
+        // Mismatching root name
+        let other_root = Frame::new_origin("other");
+        assert!(matches!(
+            other_root.apply_config_bytes(&bytes),
+            Err(CartesianTreeError::Mismatch(_))
+        ));
+    }
+
+    #[test]
+    fn test_apply_config_arrays() {
+        let root = Frame::new_origin("root");
+        let child = root
+            .add_child("child", Vector3::zeros(), UnitQuaternion::identity())
+            .unwrap();
+        let grandchild = child
+            .add_child("grandchild", Vector3::zeros(), UnitQuaternion::identity())
+            .unwrap();
+
+        root.apply_config_arrays(
+            &["root", "child", "unknown", "grandchild", "below_unknown"],
+            &[-1, 0, 0, 1, 2],
+            &[
+                0.0, 0.0, 0.0, 1.0, 2.0, 3.0, 7.0, 7.0, 7.0, 4.0, 5.0, 6.0, 8.0, 8.0, 8.0,
+            ],
+            &[
+                0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 2.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 1.0, 1.0,
+                0.0, 0.0, 0.0, 1.0,
+            ],
+        )
+        .unwrap();
+
+        assert_eq!(child.position(), Vector3::new(1.0, 2.0, 3.0));
+        assert_relative_eq!(
+            child.orientation().as_quaternion(),
+            UnitQuaternion::identity(),
+            epsilon = 1e-12
+        );
+        assert_eq!(grandchild.position(), Vector3::new(4.0, 5.0, 6.0));
+        assert_relative_eq!(
+            grandchild.orientation().as_quaternion(),
+            UnitQuaternion::from_euler_angles(0.0, 0.0, std::f64::consts::FRAC_PI_2),
+            epsilon = 1e-12
+        );
+        assert_relative_eq!(
+            grandchild
+                .transformation_to(&root)
+                .unwrap()
+                .translation
+                .vector,
+            Vector3::new(5.0, 7.0, 9.0),
+            epsilon = 1e-12
+        );
+
+        assert!(matches!(
+            root.apply_config_arrays(&["root", "child"], &[-1, 1], &[0.0; 6], &[0.0; 8]),
+            Err(CartesianTreeError::Mismatch(_))
+        ));
+        assert!(matches!(
+            root.apply_config_arrays(&["other"], &[-1], &[0.0; 3], &[0.0; 4]),
+            Err(CartesianTreeError::Mismatch(_))
+        ));
+        assert!(matches!(
+            root.apply_config_arrays(&["root"], &[-1], &[0.0; 6], &[0.0; 4]),
+            Err(CartesianTreeError::Mismatch(_))
+        ));
+    }
+
     #[test]
     fn test_to_json_and_apply_config() {
         let root = Frame::new_origin("root");
@@ -4,6 +4,7 @@
 //! and orientation relative to its parent. You can create hierarchical transformations
 //! and convert poses between frames.
 
+pub mod batch;
 pub mod errors;
 pub mod frame;
 pub mod lazy_access;
@@ -29,6 +30,7 @@ fn cartesian_tree(_py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<bindings::frame::PyFrame>()?;
     m.add_class::<bindings::pose::PyPose>()?;
     m.add_class::<bindings::utils::PyVector3>()?;
+    m.add_class::<bindings::utils::PyVector3Array>()?;
     m.add_class::<bindings::utils::PyRotation>()?;
     m.add_class::<bindings::utils::PyIsometry>()?;
     m.add_class::<bindings::lazy_access::PyLazyTranslation>()?;
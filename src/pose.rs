@@ -2,7 +2,6 @@ use crate::CartesianTreeError;
 use crate::frame::{Frame, FrameData};
 use crate::lazy_access::{LazyRotation, LazyTranslation};
 use crate::rotation::Rotation;
-use crate::tree::Walking;
 use nalgebra::{Isometry3, Translation3, Vector3};
 use std::cell::RefCell;
 use std::ops::{Add, Mul, Sub};
@@ -168,19 +167,11 @@ impl Pose {
             .upgrade()
             .ok_or(CartesianTreeError::WeakUpgradeFailed())?;
         let source = Frame { data: source_data };
-        let ancestor = source
-            .lca_with(target)
-            .ok_or_else(|| CartesianTreeError::NoCommonAncestor(source.name(), target.name()))?;
-
-        // Transformation from source frame up to ancestor
-        let tf_up = source.walk_up_and_transform(&ancestor)? * self.transform_to_parent;
-
-        // Transformation from target frame up to ancestor (to be inverted)
-        let tf_down = target.walk_up_and_transform(&ancestor)?;
+        let source_to_target = source.transformation_to(target)?;
 
         Ok(Self {
             parent: target.downgrade(),
-            transform_to_parent: tf_down.inverse() * tf_up,
+            transform_to_parent: source_to_target * self.transform_to_parent,
         })
     }
 }
@@ -11,9 +11,14 @@ pub enum Rotation {
 
 impl Rotation {
     /// Creates a Rotation from a quaternion (x, y, z, w).
+    ///
+    /// The quaternion is normalized by multiplying with its reciprocal norm, which needs a single
+    /// division instead of one per component.
     #[must_use]
     pub fn from_quaternion(x: f64, y: f64, z: f64, w: f64) -> Self {
-        Self::Quaternion(UnitQuaternion::new_normalize(Quaternion::new(w, x, y, z)))
+        let quaternion = Quaternion::new(w, x, y, z);
+        let inv_norm = quaternion.norm().recip();
+        Self::Quaternion(UnitQuaternion::new_unchecked(quaternion * inv_norm))
     }
 
     /// Creates a Rotation from RPY angles in radians (roll, pitch, yaw).
@@ -55,3 +60,19 @@ impl From<UnitQuaternion<f64>> for Rotation {
         Self::Quaternion(q)
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use approx::assert_relative_eq;
+
+    #[test]
+    fn from_quaternion_normalizes_input() {
+        let rotation = Rotation::from_quaternion(0.0, 0.0, 0.707, 0.707);
+        let expected = UnitQuaternion::new_normalize(Quaternion::new(0.707, 0.0, 0.0, 0.707));
+
+        let quaternion = rotation.as_quaternion();
+        assert_relative_eq!(quaternion.norm(), 1.0, epsilon = 1e-15);
+        assert_relative_eq!(quaternion, expected, epsilon = 1e-15);
+    }
+}
@@ -4,6 +4,13 @@ pub trait HasParent {
 
     /// Returns the parent of this node, if it exists.
     fn parent(&self) -> Option<Self::Node>;
+
+    /// Returns the depth of this node if it is known without walking up the tree.
+    ///
+    /// Used by [`Walking::depth`]; nodes that track their depth can override it.
+    fn known_depth(&self) -> Option<usize> {
+        None
+    }
 }
 
 /// Defines the equality trait.
@@ -24,10 +31,15 @@ pub trait HasChildren {
 pub trait Walking: HasParent<Node = Self> + NodeEquality + Clone {
     /// Gets the depth of this node in comparison to the root.
     ///
+    /// Uses [`HasParent::known_depth`] if available and walks up to the root otherwise.
+    ///
     /// # Returns
     ///
     /// The depth of this node in comparison to the root.
     fn depth(&self) -> usize {
+        if let Some(depth) = self.known_depth() {
+            return depth;
+        }
         let mut depth = 0;
         let mut current = self.clone();
         while let Some(parent) = current.parent() {
@@ -120,6 +132,22 @@ mod tests {
         assert_eq!(grandchild.depth(), 2);
     }
 
+    #[test]
+    fn test_depth_of_orphaned_frames() {
+        let child = Frame::new_origin("root")
+            .add_child("child", Vector3::zeros(), UnitQuaternion::identity())
+            .unwrap();
+        let grandchild = child
+            .add_child("grandchild", Vector3::zeros(), UnitQuaternion::identity())
+            .unwrap();
+
+        // The root is dropped, so `child` is the top of the remaining chain.
+        assert!(child.parent().is_none());
+        assert_eq!(child.depth(), 0);
+        assert_eq!(grandchild.depth(), 1);
+        assert!(grandchild.root().is_same(&child));
+    }
+
     #[test]
     fn test_walk_up() {
         let root = Frame::new_origin("root");